@@ -1,14 +1,7 @@
 import tkinter as tk
-import json
 import os
-from core.container import (
-    create_enhanced_container,
-    register_default_services,
-    ServiceContainer,
-)
-from ui.main_window import MainWindow
-from ui.event_handlers import EventHandlers
-from core.services.theme_service import ThemeService
+from core.config._cache import load_json_cached
+from core.container import create_enhanced_container, ServiceContainer
 
 
 class App:
@@ -18,7 +11,12 @@ class App:
         self.root = root
         self.root.title("Class Editor")
         self.root.geometry("900x600")
-        
+
+        # 延遲導入重量級模塊，縮短窗口出現前的導入時間
+        from core.container import register_default_services
+        from ui.main_window import MainWindow
+        from ui.event_handlers import EventHandlers
+
         # 将应用实例存储到根窗口中，便于其他组件访问
         self.root._app_instance = self
 
@@ -31,17 +29,26 @@ class App:
         # 3. 註冊所有服務
         register_default_services(self.container, root, self.config)
 
-        # 3.1 應用默認主題以避免啟動閃爍
-        theme_service = self.container.resolve(ThemeService)
-        theme_service.apply_theme('light')
+        # 3.1 在首個空閒週期應用默認主題；主題安裝前先隱藏窗口以避免閃爍
+        self.root.withdraw()
+        self.root.after(0, self._apply_initial_theme)
 
         # 4. 解析UI和事件處理器
         self.ui = self.container.resolve(MainWindow)
         self.event_handlers = self.container.resolve(EventHandlers)
 
-        # 5. 連接UI和事件處理器
+        # 5. 連接UI和事件處理器，界面在事件循環啟動後分步構建
         self.ui.set_event_handlers(self.event_handlers)
-        self.ui.setup_ui()
+        self.root.after_idle(self.ui.setup_ui_deferred)
+
+    def _apply_initial_theme(self):
+        """加載並應用默認主題，然後顯示窗口"""
+        from core.services.theme_service import ThemeService
+
+        try:
+            self.container.resolve(ThemeService).apply_theme('light')
+        finally:
+            self.root.deiconify()
 
     def _load_config(self) -> dict:
         """加載配置文件"""
@@ -54,15 +61,13 @@ class App:
         }
 
         try:
-            if os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    # 合併默認配置
-                    default_config.update(config)
-            return default_config
+            # 合併默認配置
+            default_config.update(load_json_cached(config_path))
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Warning: Could not load config file: {e}")
-            return default_config
+        return default_config
 
     def get_container(self) -> ServiceContainer:
         """獲取服務容器實例"""
@@ -1,4 +1,5 @@
-import PyInstaller.__main__
+import argparse
+import os
 import shutil
 import time
 from pathlib import Path
@@ -15,6 +16,12 @@ ICON_FILE = None  # Example: "assets/app.ico"
 # Directories to clean before and after the build
 CLEAN_DIRS = ["build", "dist"]
 
+# Directories holding PyInstaller's analysis cache; kept while the spec is unchanged
+CACHE_DIRS = ["build"]
+
+# Generated PyInstaller spec file, reused between builds when its inputs are unchanged
+SPEC_FILE = "app.spec"
+
 # Data files and directories to be included in the build
 # Format: ("source_path", "destination_in_bundle")
 DATA_TO_ADD = [
@@ -23,6 +30,20 @@ DATA_TO_ADD = [
     ("config.json", "."),  # Add config.json to the root
 ]
 
+# Default packaging mode: "onedir" avoids unpacking the bundle into a temp
+# directory on every launch; "onefile" is kept for single-exe distribution.
+DEFAULT_PACK_MODE = "onedir"
+
+# Compression used for the distributable zip. The bundle is already mostly
+# compressed data (PYZ, DLLs, PNGs), so storing is far faster for a similar size.
+# (Values are zipfile constant names; zipfile is only imported when archiving.)
+ARCHIVE_COMPRESSION = {
+    "stored": "ZIP_STORED",
+    "deflated": "ZIP_DEFLATED",
+    "lzma": "ZIP_LZMA",
+}
+DEFAULT_ARCHIVE_COMPRESSION = "stored"
+
 # PyInstaller hidden imports
 # Add modules that PyInstaller might not detect automatically
 HIDDEN_IMPORTS = [
@@ -38,64 +59,192 @@ def get_build_version():
     timestamp = time.strftime("%Y%m%d")
     return f"{APP_VERSION}_{timestamp}"
 
-def build():
-    """Main build function to run PyInstaller and package the app."""
-    project_root = Path(__file__).parent
-    build_version = get_build_version()
-    exe_name = f"{APP_NAME}_v{build_version}"
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py - do not edit by hand.
+# build-key: {build_key}
 
-    # 1. Clean up previous builds
-    print("--- Cleaning up old build directories ---")
-    for dir_name in CLEAN_DIRS:
-        dir_path = project_root / dir_name
-        if dir_path.exists():
-            print(f"Removing directory: {dir_path}")
-            shutil.rmtree(dir_path)
+a = Analysis(
+    [{script!r}],
+    pathex=[],
+    binaries=[],
+    datas={datas!r},
+    hiddenimports={hidden_imports!r},
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+{exe_block}"""
 
-    # 2. Assemble PyInstaller command
-    print("\n--- Assembling PyInstaller command ---")
-    args = [
-        "--onefile",
-        "--windowed",
-        "--noconfirm",
-        f"--name={exe_name}",
-    ]
+ONEFILE_EXE_BLOCK = """
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name={name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    icon={icon!r},
+)
+"""
 
-    if ICON_FILE:
-        icon_path = project_root / ICON_FILE
-        if icon_path.exists():
-            args.append(f"--icon={icon_path}")
-            print(f"Icon added: {icon_path}")
-        else:
-            print(f"Warning: Icon file not found at {icon_path}")
+ONEDIR_EXE_BLOCK = """
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name={name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,
+    contents_directory='.',
+    icon={icon!r},
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name={name!r},
+)
+"""
+
+
+def get_spec_inputs(project_root):
+    """Returns the files whose changes require regenerating the spec."""
+    inputs = [Path(__file__), project_root / MAIN_SCRIPT]
+    inputs.extend(project_root / src for src, _ in DATA_TO_ADD)
+    return inputs
 
+
+def is_spec_fresh(spec_path, build_key, project_root):
+    """Checks whether the spec exists, matches build_key and is newer than its inputs."""
+    if not spec_path.exists():
+        return False
+    with open(spec_path, "r", encoding="utf-8") as f:
+        if f"# build-key: {build_key}" not in f.read(512):
+            return False
+    spec_mtime = spec_path.stat().st_mtime
+    return all(
+        not path.exists() or path.stat().st_mtime <= spec_mtime
+        for path in get_spec_inputs(project_root)
+    )
+
+
+def write_spec(project_root, exe_name, pack_mode, build_key):
+    """Writes a PyInstaller .spec file for the app and returns its path."""
+    datas = []
     for src, dest in DATA_TO_ADD:
         src_path = project_root / src
         if src_path.exists():
-            args.append(f"--add-data={src_path};{dest}")
+            datas.append((str(src_path), dest))
             print(f"Data added: {src_path} -> {dest}")
         else:
             print(f"Warning: Data source not found at {src_path}")
 
     for hidden_import in HIDDEN_IMPORTS:
-        args.append(f"--hidden-import={hidden_import}")
         print(f"Hidden import added: {hidden_import}")
 
+    icon = None
+    if ICON_FILE:
+        icon_path = project_root / ICON_FILE
+        if icon_path.exists():
+            icon = [str(icon_path)]
+            print(f"Icon added: {icon_path}")
+        else:
+            print(f"Warning: Icon file not found at {icon_path}")
+
+    exe_block = ONEDIR_EXE_BLOCK if pack_mode == "onedir" else ONEFILE_EXE_BLOCK
+    spec_path = project_root / SPEC_FILE
+    with open(spec_path, "w", encoding="utf-8") as f:
+        f.write(
+            SPEC_TEMPLATE.format(
+                build_key=build_key,
+                script=str(project_root / MAIN_SCRIPT),
+                datas=datas,
+                hidden_imports=HIDDEN_IMPORTS,
+                exe_block=exe_block.format(name=exe_name, icon=icon),
+            )
+        )
+    print(f"Spec file written: {spec_path}")
+    return spec_path
+
+
+def create_zip_archive(zip_path, root_dir, base_dir=None, compression=DEFAULT_ARCHIVE_COMPRESSION):
+    """Zips root_dir (or root_dir/base_dir, keeping base_dir in the paths) into zip_path."""
+    import zipfile
+
+    source_dir = Path(root_dir) / base_dir if base_dir else Path(root_dir)
+    zip_compression = getattr(zipfile, ARCHIVE_COMPRESSION[compression])
+    with zipfile.ZipFile(zip_path, "w", compression=zip_compression) as zf:
+        for dirpath, _, filenames in os.walk(source_dir):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                zf.write(file_path, arcname=os.path.relpath(file_path, root_dir))
+
+
+def build(pack_mode=DEFAULT_PACK_MODE, compression=DEFAULT_ARCHIVE_COMPRESSION):
+    """Main build function to run PyInstaller and package the app."""
+    project_root = Path(__file__).parent
+    build_version = get_build_version()
+    exe_name = f"{APP_NAME}_v{build_version}"
+
     script_path = project_root / MAIN_SCRIPT
     if not script_path.exists():
         print(f"Error: Main script '{script_path}' not found!")
         return
-    args.append(str(script_path))
 
+    # 1. Prepare the spec file, reusing it (and the analysis cache) when unchanged
+    print("--- Preparing PyInstaller spec ---")
+    print(f"Pack mode: {pack_mode}")
+    spec_path = project_root / SPEC_FILE
+    build_key = f"{exe_name} {pack_mode}"
+    spec_fresh = is_spec_fresh(spec_path, build_key, project_root)
+    if spec_fresh:
+        print(f"Reusing up-to-date spec file: {spec_path}")
+    else:
+        spec_path = write_spec(project_root, exe_name, pack_mode, build_key)
+
+    # 2. Clean up previous builds; keep the build cache when the spec is reused
+    print("\n--- Cleaning up old build directories ---")
+    for dir_name in CLEAN_DIRS:
+        if spec_fresh and dir_name in CACHE_DIRS:
+            continue
+        dir_path = project_root / dir_name
+        if dir_path.exists():
+            print(f"Removing directory: {dir_path}")
+            shutil.rmtree(dir_path)
+
+    args = [str(spec_path), "--noconfirm"]
     print(f"\nBuild command: pyinstaller {' '.join(args)}")
 
     # 3. Run PyInstaller
     print("\n--- Starting PyInstaller build ---")
+    # Imported here: PyInstaller pulls in hundreds of modules and is only needed for this step
+    import PyInstaller.__main__
+
     try:
         PyInstaller.__main__.run(args)
         print("\n--- Build successful! ---")
         dist_path = project_root / "dist"
-        print(f"Executable created at: {dist_path / (exe_name + '.exe')}")
+        if pack_mode == "onedir":
+            print(f"Application folder created at: {dist_path / exe_name}")
+        else:
+            print(f"Executable created at: {dist_path / (exe_name + '.exe')}")
     except Exception as e:
         print(f"\n--- Build failed! ---")
         print(f"Error: {e}")
@@ -107,12 +256,39 @@ def build():
     archive_name = f"{APP_NAME}_v{build_version}"
     archive_path = project_root / archive_name
 
+    # In onedir mode, archive the per-app folder so the zip holds the runnable directory
+    base_dir = exe_name if pack_mode == "onedir" else None
+
     try:
-        shutil.make_archive(str(archive_path), 'zip', dist_path)
-        print(f"Successfully created zip file: {archive_path}.zip")
+        create_zip_archive(
+            f"{archive_path}.zip",
+            dist_path,
+            base_dir,
+            compression=compression,
+        )
+        print(f"Successfully created zip file: {archive_path}.zip ({compression})")
     except Exception as e:
         print(f"Failed to create zip file: {e}")
 
 
+def parse_args():
+    """Parses command line arguments for the build script."""
+    parser = argparse.ArgumentParser(description=f"Build {APP_NAME} with PyInstaller")
+    parser.add_argument(
+        "--pack",
+        choices=("onedir", "onefile"),
+        default=DEFAULT_PACK_MODE,
+        help=f"PyInstaller packaging mode (default: {DEFAULT_PACK_MODE})",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=tuple(ARCHIVE_COMPRESSION),
+        default=DEFAULT_ARCHIVE_COMPRESSION,
+        help=f"Zip compression for the archive (default: {DEFAULT_ARCHIVE_COMPRESSION})",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    build()
+    args = parse_args()
+    build(args.pack, args.compression)
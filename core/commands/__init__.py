@@ -3,31 +3,51 @@
 
 這個模塊實現了命令模式，用於統一處理所有用戶操作，
 提供更好的解耦和可測試性。
+具體命令類按需（首次訪問時）從 ui_commands 加載。
 """
 
+import importlib
+
 from .command_interface import ICommand
-from .ui_commands import (
-    LoadDirectoryCommand,
-    SaveFileCommand,
-    SaveAllFilesCommand,
-    SaveProjectCommand,
-    LoadProjectCommand,
-    TranslateCommand,
-    TranslateAllCommand,
-    ApplyChangesCommand,
-    HighlightToggleCommand,
-    ShowFindDialogCommand,
-    ShowFindReplaceDialogCommand,
-    ShowTranslationSettingsCommand,
-    ShowAboutCommand,
-    TreeSelectCommand,
-    TabChangedCommand,
-    TextModifiedCommand,
-    ShowFileTypeConfigCommand,
-    TextRealtimeChangeCommand,
-)
 from .command_invoker import CommandInvoker
 
+# 延遲導出的命令類，首次訪問時才導入（PEP 562）
+_LAZY_COMMANDS = frozenset(
+    {
+        "LoadDirectoryCommand",
+        "SaveFileCommand",
+        "SaveAllFilesCommand",
+        "SaveProjectCommand",
+        "LoadProjectCommand",
+        "TranslateCommand",
+        "TranslateAllCommand",
+        "ApplyChangesCommand",
+        "HighlightToggleCommand",
+        "ShowFindDialogCommand",
+        "ShowFindReplaceDialogCommand",
+        "ShowTranslationSettingsCommand",
+        "ShowAboutCommand",
+        "TreeSelectCommand",
+        "TabChangedCommand",
+        "TextModifiedCommand",
+        "ShowFileTypeConfigCommand",
+        "TextRealtimeChangeCommand",
+    }
+)
+
+
+def __getattr__(name: str):
+    """按需導入命令類"""
+    if name not in _LAZY_COMMANDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".ui_commands", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_COMMANDS)
+
 __all__ = [
     "ICommand",
     "LoadDirectoryCommand",
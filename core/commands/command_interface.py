@@ -11,6 +11,8 @@ from typing import Any, Optional
 class ICommand(ABC):
     """命令接口 - 所有用戶操作命令的基類"""
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, *args, **kwargs) -> Optional[Any]:
         """
@@ -25,15 +27,14 @@ class ICommand(ABC):
         """
         pass
 
-    @abstractmethod
     def can_execute(self) -> bool:
         """
-        檢查命令是否可以執行
+        檢查命令是否可以執行，默認總是可以執行，需要條件檢查的子類覆蓋此方法
 
         Returns:
             bool: True如果命令可以執行，False否則
         """
-        pass
+        return True
 
     def get_description(self) -> str:
         """
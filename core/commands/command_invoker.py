@@ -5,16 +5,27 @@
 """
 
 import logging
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict, Tuple
 from .command_interface import ICommand
 
+_LOG = logging.getLogger(__name__)
+
+
+def _is_always_executable(command: ICommand) -> bool:
+    """判斷命令是否總是可執行（執行前可跳過 can_execute 檢查）"""
+    # 未覆蓋默認 can_execute 的命令總是可執行
+    if type(command).can_execute is ICommand.can_execute:
+        return True
+    return bool(getattr(command, "always_executable", False))
+
 
 class CommandInvoker:
     """命令調用器 - 統一執行所有用戶命令"""
 
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self._commands: Dict[str, ICommand] = {}
+        # 命令名稱 -> (命令實例, 是否總是可執行)
+        self._commands: Dict[str, Tuple[ICommand, bool]] = {}
+        self._handlers: Dict[str, Callable] = {}  # 已創建的UI處理器緩存
 
     def register_command(self, name: str, command: ICommand):
         """
@@ -24,8 +35,9 @@ class CommandInvoker:
             name: 命令名稱
             command: 命令實例
         """
-        self._commands[name] = command
-        self.logger.debug(f"註冊命令: {name}")
+        self._commands[name] = (command, _is_always_executable(command))
+        self._handlers.pop(name, None)
+        _LOG.debug(f"註冊命令: {name}")
 
     def execute_command(self, name: str, *args, **kwargs) -> Optional[Any]:
         """
@@ -39,20 +51,21 @@ class CommandInvoker:
         Returns:
             Optional[Any]: 命令執行結果
         """
-        command = self._commands.get(name)
-        if not command:
-            self.logger.error(f"未找到命令: {name}")
+        entry = self._commands.get(name)
+        if entry is None:
+            _LOG.error(f"未找到命令: {name}")
             return None
 
-        if not command.can_execute():
-            self.logger.warning(f"命令無法執行: {name}")
+        command, always_executable = entry
+        if not always_executable and not command.can_execute():
+            _LOG.warning(f"命令無法執行: {name}")
             return None
 
         try:
-            self.logger.debug(f"執行命令: {name}")
+            _LOG.debug(f"執行命令: {name}")
             return command.execute(*args, **kwargs)
         except Exception as e:
-            self.logger.error(f"命令執行失敗: {name}, 錯誤: {e}")
+            _LOG.error(f"命令執行失敗: {name}, 錯誤: {e}")
             raise
 
     def can_execute_command(self, name: str) -> bool:
@@ -65,8 +78,11 @@ class CommandInvoker:
         Returns:
             bool: True如果命令可以執行
         """
-        command = self._commands.get(name)
-        return command.can_execute() if command else False
+        entry = self._commands.get(name)
+        if entry is None:
+            return False
+        command, always_executable = entry
+        return always_executable or command.can_execute()
 
     def get_registered_commands(self) -> Dict[str, str]:
         """
@@ -75,21 +91,28 @@ class CommandInvoker:
         Returns:
             Dict[str, str]: 命令名稱到描述的映射
         """
-        return {name: cmd.get_description() for name, cmd in self._commands.items()}
+        return {
+            name: cmd.get_description() for name, (cmd, _) in self._commands.items()
+        }
 
     def create_command_handler(self, command_name: str):
         """
         創建命令處理器函數，用於UI綁定
 
+        同一命令名稱重複調用時返回同一個函數對象。
+
         Args:
             command_name: 命令名稱
 
         Returns:
             callable: 可用於UI綁定的函數
         """
+        handler = self._handlers.get(command_name)
+        if handler is None:
 
-        def handler(*args, **kwargs):
-            return self.execute_command(command_name, *args, **kwargs)
+            def handler(*args, **kwargs):
+                return self.execute_command(command_name, *args, **kwargs)
 
-        handler.__name__ = f"handle_{command_name}"
+            handler.__name__ = f"handle_{command_name}"
+            self._handlers[command_name] = handler
         return handler
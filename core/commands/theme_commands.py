@@ -4,11 +4,16 @@
 
 import logging
 from .command_interface import ICommand
+
+_LOG = logging.getLogger(__name__)
+
+
 class ShowThemeDialogCommand(ICommand):
     """显示主题选择对话框命令"""
 
+    __slots__ = ("theme_handlers",)
+
     def __init__(self, theme_handlers: 'ThemeHandlers'):
-        self.logger = logging.getLogger(__name__)
         self.theme_handlers = theme_handlers
 
     def can_execute(self) -> bool:
@@ -21,7 +26,7 @@ class ShowThemeDialogCommand(ICommand):
             if self.can_execute():
                 self.theme_handlers.on_show_theme_dialog()
         except Exception as e:
-            self.logger.error(f"执行主题对话框命令失败: {e}")
+            _LOG.error(f"执行主题对话框命令失败: {e}")
             from core.events import get_event_system, ErrorDialogEvent
             event_system = get_event_system()
             event_system.publish(ErrorDialogEvent("错误", f"无法显示主题设置对话框: {e}"))
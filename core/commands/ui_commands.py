@@ -2,254 +2,174 @@
 UI相關命令實現
 
 實現了所有UI操作的命令類，統一處理用戶交互。
+所有UI命令都只是委託給事件處理器的某個方法，因此由一個通用的
+MethodCommand 加上命令規格表生成，而不是逐個定義命令類。
 """
 
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 from .command_interface import ICommand
 
+# 調用事件處理器方法時的參數傳遞方式
+ARGS_NONE = "none"  # 不傳遞參數
+ARGS_EVENT = "event"  # 只傳遞事件對象（可選）
+ARGS_ALL = "all"  # 傳遞所有位置參數
 
-class LoadDirectoryCommand(ICommand):
-    """加載目錄命令"""
 
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_load_directory()
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class SaveFileCommand(ICommand):
-    """保存文件命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_save_file()
-
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.has_open_files()
-
-
-class SaveAllFilesCommand(ICommand):
-    """保存所有文件命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_save_all_files()
-
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.has_open_files()
-
-
-class SaveProjectCommand(ICommand):
-    """保存工程命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_save_project()
-
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.has_open_files()
-
-
-class LoadProjectCommand(ICommand):
-    """加載工程命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_load_project()
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class TranslateCommand(ICommand):
-    """翻譯命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_translate()
+def _has_open_files(event_handlers) -> bool:
+    return event_handlers.state_manager.has_open_files()
 
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.get_selected_entry() is not None
-
-
-class TranslateAllCommand(ICommand):
-    """翻譯全部命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
 
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_translate_all()
+def _has_selected_entry(event_handlers) -> bool:
+    return event_handlers.state_manager.get_selected_entry() is not None
 
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.has_open_files()
 
+class MethodCommand(ICommand):
+    """委託給事件處理器方法的通用命令"""
 
-class ApplyChangesCommand(ICommand):
-    """應用更改命令"""
+    __slots__ = ("event_handlers", "_name", "_method", "_gate", "_arg_mode")
 
-    def __init__(self, event_handlers):
+    def __init__(
+        self,
+        event_handlers,
+        name: str,
+        method: str,
+        gate: Optional[Callable[[Any], bool]] = None,
+        arg_mode: str = ARGS_NONE,
+    ):
+        """
+        Args:
+            event_handlers: 事件處理器
+            name: 命令名稱（用作描述）
+            method: 要調用的事件處理器方法名
+            gate: 可執行性檢查函數，None表示總是可執行
+            arg_mode: 參數傳遞方式
+        """
         self.event_handlers = event_handlers
+        self._name = name
+        self._method = method
+        self._gate = gate
+        self._arg_mode = arg_mode
 
     def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_text_changed(*args)
-
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.get_selected_entry() is not None
-
-
-class HighlightToggleCommand(ICommand):
-    """切換高亮命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_highlight_toggle()
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class ShowFindDialogCommand(ICommand):
-    """顯示查找對話框命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.show_find_dialog()
-
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.has_open_files()
-
-
-class ShowFindReplaceDialogCommand(ICommand):
-    """顯示查找替換對話框命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.show_find_replace_dialog()
-
-    def can_execute(self) -> bool:
-        return self.event_handlers.state_manager.has_open_files()
-
-
-class ShowTranslationSettingsCommand(ICommand):
-    """顯示翻譯設置對話框命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.show_translation_settings()
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class ShowAboutCommand(ICommand):
-    """顯示關於對話框命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.show_about()
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class TreeSelectCommand(ICommand):
-    """樹狀視圖選擇命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, event=None, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_tree_select(event)
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class TabChangedCommand(ICommand):
-    """標籤頁切換命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, event=None, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_tab_changed(event)
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class TextModifiedCommand(ICommand):
-    """文本修改命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, event=None, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_translated_text_modified(event)
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class ShowFileTypeConfigCommand(ICommand):
-    """顯示文件類型配置對話框命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_show_file_type_config()
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class TextRealtimeChangeCommand(ICommand):
-    """實時文本變更命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, event=None, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_translated_text_changed_realtime(event)
-
-    def can_execute(self) -> bool:
-        return True
-
-
-class UndoCommand(ICommand):
-    """撤回命令"""
-
-    def __init__(self, event_handlers):
-        self.event_handlers = event_handlers
-
-    def execute(self, *args, **kwargs) -> Optional[Any]:
-        return self.event_handlers.on_undo()
-
-    def can_execute(self) -> bool:
-        return True
+        method = getattr(self.event_handlers, self._method)
+        if self._arg_mode == ARGS_EVENT:
+            return method(args[0] if args else kwargs.get("event"))
+        if self._arg_mode == ARGS_ALL:
+            return method(*args)
+        return method()
+
+    @property
+    def always_executable(self) -> bool:
+        """沒有可執行性檢查的命令總是可執行"""
+        return self._gate is None
+
+    def can_execute(self) -> bool:
+        return self._gate is None or self._gate(self.event_handlers)
+
+    def get_description(self) -> str:
+        return self._name
+
+
+# 命令名稱 -> (事件處理器方法, 可執行性檢查, 參數傳遞方式, 描述)
+COMMAND_SPECS = {
+    "LoadDirectoryCommand": ("on_load_directory", None, ARGS_NONE, "加載目錄命令"),
+    "SaveFileCommand": ("on_save_file", _has_open_files, ARGS_NONE, "保存文件命令"),
+    "SaveAllFilesCommand": (
+        "on_save_all_files",
+        _has_open_files,
+        ARGS_NONE,
+        "保存所有文件命令",
+    ),
+    "SaveProjectCommand": (
+        "on_save_project",
+        _has_open_files,
+        ARGS_NONE,
+        "保存工程命令",
+    ),
+    "LoadProjectCommand": ("on_load_project", None, ARGS_NONE, "加載工程命令"),
+    "TranslateCommand": ("on_translate", _has_selected_entry, ARGS_NONE, "翻譯命令"),
+    "TranslateAllCommand": (
+        "on_translate_all",
+        _has_open_files,
+        ARGS_NONE,
+        "翻譯全部命令",
+    ),
+    "ApplyChangesCommand": (
+        "on_text_changed",
+        _has_selected_entry,
+        ARGS_ALL,
+        "應用更改命令",
+    ),
+    "HighlightToggleCommand": (
+        "on_highlight_toggle",
+        None,
+        ARGS_NONE,
+        "切換高亮命令",
+    ),
+    "ShowFindDialogCommand": (
+        "show_find_dialog",
+        _has_open_files,
+        ARGS_NONE,
+        "顯示查找對話框命令",
+    ),
+    "ShowFindReplaceDialogCommand": (
+        "show_find_replace_dialog",
+        _has_open_files,
+        ARGS_NONE,
+        "顯示查找替換對話框命令",
+    ),
+    "ShowTranslationSettingsCommand": (
+        "show_translation_settings",
+        None,
+        ARGS_NONE,
+        "顯示翻譯設置對話框命令",
+    ),
+    "ShowAboutCommand": ("show_about", None, ARGS_NONE, "顯示關於對話框命令"),
+    "TreeSelectCommand": ("on_tree_select", None, ARGS_EVENT, "樹狀視圖選擇命令"),
+    "TabChangedCommand": ("on_tab_changed", None, ARGS_EVENT, "標籤頁切換命令"),
+    "TextModifiedCommand": (
+        "on_translated_text_modified",
+        None,
+        ARGS_EVENT,
+        "文本修改命令",
+    ),
+    "ShowFileTypeConfigCommand": (
+        "on_show_file_type_config",
+        None,
+        ARGS_NONE,
+        "顯示文件類型配置對話框命令",
+    ),
+    "TextRealtimeChangeCommand": (
+        "on_translated_text_changed_realtime",
+        None,
+        ARGS_EVENT,
+        "實時文本變更命令",
+    ),
+    "UndoCommand": ("on_undo", None, ARGS_NONE, "撤回命令"),
+}
+
+
+def _make_command_class(name: str, spec: tuple) -> type:
+    """為命令規格生成與原命令類同名的 MethodCommand 子類"""
+    method, gate, arg_mode, doc = spec
+
+    def __init__(self, event_handlers):
+        MethodCommand.__init__(self, event_handlers, name, method, gate, arg_mode)
+
+    return type(
+        name,
+        (MethodCommand,),
+        {
+            "__slots__": (),
+            "__doc__": doc,
+            "__module__": __name__,
+            "__init__": __init__,
+        },
+    )
+
+
+# 保持原有的命令類可用，例如 SaveFileCommand(event_handlers)，
+# 並且仍支持 isinstance 檢查與繼承
+for _name, _spec in COMMAND_SPECS.items():
+    globals()[_name] = _make_command_class(_name, _spec)
+del _name, _spec
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+配置文件緩存模塊
+在進程內緩存解析後的JSON配置，按修改時間失效
+"""
+
+import copy
+import json
+import os
+from typing import Any, Dict, Tuple
+
+# orjson 為可選依賴，可用時解析速度更快
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 進程內緩存：絕對路徑 -> (源文件mtime, 解析結果)，同一進程內同一文件只解析一次
+# 不寫入磁盤：配置是純數據，不應讓旁邊的緩存文件成為可執行代碼的入口
+_memory_cache: Dict[str, Tuple[int, Any]] = {}
+
+
+def _parse_json(path: str) -> Any:
+    """解析JSON文件"""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_json_cached(path: str) -> Any:
+    """
+    加載JSON文件，源文件修改時間未變時使用進程內緩存
+
+    Args:
+        path: JSON文件路徑
+
+    Returns:
+        解析後的數據（每次調用返回獨立的副本）
+
+    Raises:
+        FileNotFoundError: 如果源文件不存在
+    """
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+
+    cached = _memory_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _parse_json(path))
+        _memory_cache[path] = cached
+
+    return copy.deepcopy(cached[1])
@@ -6,79 +6,176 @@
 支持用戶自定義純文本文件擴展名
 """
 
+import atexit
+import functools
 import json
 import os
-from typing import List, Set
-from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from core.config._cache import load_json_cached
+
+
+def _get_suffix(filepath: str) -> str:
+    """獲取小寫的文件擴展名（語義同 Path.suffix，但不構造 Path 對象）"""
+    name_start = filepath.rfind(os.sep)
+    if os.altsep:
+        name_start = max(name_start, filepath.rfind(os.altsep))
+    dot = filepath.rfind(".")
+    # 與 Path.suffix 一致：忽略以點開頭的文件名和以點結尾的文件名
+    if dot <= name_start + 1 or dot == len(filepath) - 1:
+        return ""
+    return filepath[dot:].lower()
+
+
+def _normalize_extension(extension: str) -> str:
+    """補全前導點並規範化為駐留的小寫擴展名"""
+    if not extension.startswith("."):
+        extension = "." + extension
+    return sys.intern(extension.lower())
+
+
+def _intern_extensions(extensions) -> Set[str]:
+    """將擴展名規範化為小寫並駐留，掃描時的集合/字典查找可直接命中同一對象"""
+    return {sys.intern(ext.lower()) for ext in extensions}
 
 
 class FileTypeConfig:
     """文件類型配置管理器"""
 
-    def __init__(self, config_file: str = "config.json"):
+    # 默認擴展名（不可變，所有實例共享）
+    _DEFAULT_TEXT_EXTS = frozenset({".t", ".txt", ".text"})
+    _DEFAULT_CLASS_EXTS = frozenset({".class"})
+
+    def __init__(
+        self,
+        config_file: str = "config.json",
+        config_dict: Optional[Dict[str, Any]] = None,
+    ):
         self.config_file = config_file
-        self.default_text_extensions = {".t", ".txt", ".text"}
-        self.default_class_extensions = {".class"}
 
         # 當前配置
         self.text_extensions: Set[str] = set()
         self.class_extensions: Set[str] = set()
 
-        # 加載配置
-        self.load_config()
+        # 擴展名 -> 文件類型 索引，擴展名變更時重建
+        self._ext_to_type: Dict[str, str] = {}
+
+        # 延遲保存狀態：連續修改只在空閒時寫入一次
+        self._dirty = False
+        self._save_scheduled = False
+        self._atexit_registered = False
+        # 空閒時執行回調的調度函數（如Tk根窗口的after_idle），未設置時在退出時保存
+        self._idle_scheduler: Optional[Callable[[Callable[[], None]], Any]] = None
+
+        # 加載配置（如已提供解析好的配置字典則不再讀取文件）
+        self.load_config(config_dict)
+
+    def load_config(self, config_data: Optional[Dict[str, Any]] = None):
+        """從配置文件加載設置
 
-    def load_config(self):
-        """從配置文件加載設置"""
+        Args:
+            config_data: 已解析的配置字典，為None時從配置文件讀取
+        """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
+            if config_data is None:
+                try:
+                    config_data = load_json_cached(self.config_file)
+                except FileNotFoundError:
+                    pass  # 配置文件不存在，使用默認配置
 
+            if config_data is not None:
                 # 加載純文本文件擴展名
                 text_exts = config_data.get(
-                    "text_file_extensions", list(self.default_text_extensions)
+                    "text_file_extensions", self._DEFAULT_TEXT_EXTS
                 )
-                self.text_extensions = set(text_exts)
+                self.text_extensions = _intern_extensions(text_exts)
 
                 # 加載CLASS文件擴展名（通常不變）
                 class_exts = config_data.get(
-                    "class_file_extensions", list(self.default_class_extensions)
+                    "class_file_extensions", self._DEFAULT_CLASS_EXTS
                 )
-                self.class_extensions = set(class_exts)
+                self.class_extensions = _intern_extensions(class_exts)
             else:
                 # 使用默認配置
-                self.text_extensions = self.default_text_extensions.copy()
-                self.class_extensions = self.default_class_extensions.copy()
-                self.save_config()
+                self.text_extensions = set(self._DEFAULT_TEXT_EXTS)
+                self.class_extensions = set(self._DEFAULT_CLASS_EXTS)
+                self._mark_dirty()
 
         except Exception as e:
             print(f"加載配置失敗，使用默認配置: {e}")
-            self.text_extensions = self.default_text_extensions.copy()
-            self.class_extensions = self.default_class_extensions.copy()
+            self.text_extensions = set(self._DEFAULT_TEXT_EXTS)
+            self.class_extensions = set(self._DEFAULT_CLASS_EXTS)
+
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """重建擴展名到文件類型的索引（CLASS優先於純文本）"""
+        index = {sys.intern(ext.lower()): "text" for ext in self.text_extensions}
+        index.update(
+            (sys.intern(ext.lower()), "class") for ext in self.class_extensions
+        )
+        self._ext_to_type = index
 
     def save_config(self):
-        """保存配置到文件"""
+        """立即保存配置到文件（先寫臨時文件再替換，避免寫入中斷損壞配置）"""
         try:
             config_data = {
                 "text_file_extensions": list(self.text_extensions),
                 "class_file_extensions": list(self.class_extensions),
             }
 
-            with open(self.config_file, "w", encoding="utf-8") as f:
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
                 json.dump(config_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
 
         except Exception as e:
             print(f"保存配置失敗: {e}")
 
+    def _mark_dirty(self):
+        """標記配置已修改，並安排在Tk空閒時（或退出時）統一保存"""
+        self._dirty = True
+
+        # 退出時兜底保存，防止空閒回調未執行
+        if not self._atexit_registered:
+            atexit.register(self._flush)
+            self._atexit_registered = True
+
+        self._schedule_flush()
+
+    def set_idle_scheduler(
+        self, scheduler: Optional[Callable[[Callable[[], None]], Any]]
+    ):
+        """設置空閒調度函數（如 root.after_idle），已有未保存的修改時立即安排保存"""
+        self._idle_scheduler = scheduler
+        if self._dirty:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """通過空閒調度函數安排一次保存"""
+        if self._save_scheduled or self._idle_scheduler is None:
+            return
+        try:
+            self._idle_scheduler(self._flush)
+            self._save_scheduled = True
+        except Exception:
+            pass  # 例如根窗口已銷毀，交由退出時保存
+
+    def _flush(self):
+        """如有未保存的修改則寫入文件"""
+        self._save_scheduled = False
+        if self._dirty:
+            self.save_config()
+
     def is_text_file(self, filepath: str) -> bool:
         """檢查文件是否為純文本文件"""
-        ext = Path(filepath).suffix.lower()
-        return ext in self.text_extensions
+        return _get_suffix(filepath) in self.text_extensions
 
     def is_class_file(self, filepath: str) -> bool:
         """檢查文件是否為CLASS文件"""
-        ext = Path(filepath).suffix.lower()
-        return ext in self.class_extensions
+        return self.get_file_type(filepath) == "class"
 
     def is_supported_file(self, filepath: str) -> bool:
         """檢查文件是否為支持的文件類型"""
@@ -86,30 +183,35 @@ class FileTypeConfig:
 
     def get_file_type(self, filepath: str) -> str:
         """獲取文件類型"""
-        if self.is_class_file(filepath):
-            return "class"
-        elif self.is_text_file(filepath):
-            return "text"
-        else:
-            return "unknown"
+        return self._ext_to_type.get(_get_suffix(filepath), "unknown")
 
     def add_text_extension(self, extension: str):
         """添加純文本文件擴展名"""
-        if not extension.startswith("."):
-            extension = "." + extension
-
-        extension = extension.lower()
-        self.text_extensions.add(extension)
-        self.save_config()
+        self.text_extensions.add(_normalize_extension(extension))
+        self._rebuild_index()
+        self._mark_dirty()
 
     def remove_text_extension(self, extension: str):
         """移除純文本文件擴展名"""
-        if not extension.startswith("."):
-            extension = "." + extension
-
-        extension = extension.lower()
-        self.text_extensions.discard(extension)
-        self.save_config()
+        self.text_extensions.discard(_normalize_extension(extension))
+        self._rebuild_index()
+        self._mark_dirty()
+
+    def update_text_extensions(self, extensions: Iterable[str]):
+        """整體替換純文本文件擴展名，有變化時只重建索引並保存一次"""
+        new_extensions = {_normalize_extension(ext) for ext in extensions}
+        if new_extensions != self.text_extensions:
+            self.text_extensions = new_extensions
+            self._rebuild_index()
+            self._mark_dirty()
+
+    def update_class_extensions(self, extensions: Iterable[str]):
+        """整體替換CLASS文件擴展名，有變化時只重建索引並保存一次"""
+        new_extensions = {_normalize_extension(ext) for ext in extensions}
+        if new_extensions != self.class_extensions:
+            self.class_extensions = new_extensions
+            self._rebuild_index()
+            self._mark_dirty()
 
     def get_text_extensions(self) -> List[str]:
         """獲取純文本文件擴展名列表"""
@@ -121,37 +223,54 @@ class FileTypeConfig:
 
     def reset_to_defaults(self):
         """重置為默認配置"""
-        self.text_extensions = self.default_text_extensions.copy()
-        self.class_extensions = self.default_class_extensions.copy()
-        self.save_config()
+        self.text_extensions = set(self._DEFAULT_TEXT_EXTS)
+        self.class_extensions = set(self._DEFAULT_CLASS_EXTS)
+        self._rebuild_index()
+        self._mark_dirty()
 
     def get_supported_files_in_directory(self, directory: str) -> dict:
         """獲取目錄中支持的文件，按類型分組"""
         result = {"text": [], "class": [], "unknown": []}
 
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    file_type = self.get_file_type(filepath)
-                    result[file_type].append(filepath)
-
+            for filepath, file_type in self.iter_supported_files(directory):
+                result[file_type].append(filepath)
         except Exception as e:
             print(f"掃描目錄失敗: {e}")
 
         return result
 
+    def iter_supported_files(self, directory: str) -> Iterator[Tuple[str, str]]:
+        """迭代掃描目錄（不遞歸調用），逐個產出 (文件路徑, 文件類型)
+
+        無法讀取的子目錄會被跳過。
+        """
+        ext_index = self._ext_to_type
+        stack = [directory]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        # 與 os.walk 一致：不跟隨目錄符號鏈接
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                        name = entry.name
+                        dot = name.rfind(".")
+                        ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+                        yield entry.path, ext_index.get(ext, "unknown")
+            except OSError:
+                pass  # 與 os.walk 一致，跳過無法讀取的目錄
+            # 逆序入棧，使子目錄按掃描順序處理
+            stack.extend(reversed(subdirs))
+
     def __str__(self):
         return f"FileTypeConfig(text={self.text_extensions}, class={self.class_extensions})"
 
 
-# 全局配置實例
-_global_config = None
-
-
+@functools.cache
 def get_file_type_config() -> FileTypeConfig:
-    """獲取全局文件類型配置實例"""
-    global _global_config
-    if _global_config is None:
-        _global_config = FileTypeConfig()
-    return _global_config
+    """獲取全局文件類型配置實例（首次調用時創建）"""
+    return FileTypeConfig()
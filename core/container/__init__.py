@@ -2,44 +2,64 @@
 依賴注入容器模塊
 
 提供服務容器、依賴解析和生命週期管理功能的統一入口。
+配置驅動相關的導出按需（首次訪問時）加載。
 """
 
+import importlib
+
 from .service_container import (
     ServiceContainer,
     IServiceContainer,
     ServiceLifecycle,
     ServiceRegistration,
 )
-from .service_registration import register_default_services
 from .dependency_resolver import DependencyResolver
 from .service_lifecycle import ServiceLifecycleManager, get_lifecycle_manager
-from .service_config import (
-    ContainerConfiguration,
-    ServiceConfiguration,
-    ServiceScope,
-    ServiceType,
-    ServiceDependency,
-    ServiceConfigurationManager,
-    get_config_manager,
-)
-from .config_driven_registrar import (
-    ConfigDrivenServiceRegistrar,
-    ConfigurationBasedContainerBuilder,
-    create_container_from_config,
-    create_container_from_file,
-)
 
-# 全局服務容器實例
-_global_container = None
+# 延遲導出：名稱 -> 子模塊，首次訪問時才導入（PEP 562）
+_LAZY_EXPORTS = {
+    "register_default_services": ".service_registration",
+    "ContainerConfiguration": ".service_config",
+    "ServiceConfiguration": ".service_config",
+    "ServiceScope": ".service_config",
+    "ServiceType": ".service_config",
+    "ServiceDependency": ".service_config",
+    "ServiceConfigurationManager": ".service_config",
+    "get_config_manager": ".service_config",
+    "ConfigDrivenServiceRegistrar": ".config_driven_registrar",
+    "ConfigurationBasedContainerBuilder": ".config_driven_registrar",
+    "create_container_from_config": ".config_driven_registrar",
+    "create_container_from_file": ".config_driven_registrar",
+    "LazyProxy": ".lazy_proxy",
+}
+
+
+def __getattr__(name: str):
+    """按需導入延遲導出的名稱"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+def create_enhanced_container() -> ServiceContainer:
+    """創建增強的服務容器"""
+    container = ServiceContainer()
+    container.enable_auto_resolution()
+    return container
+
+
+# 全局服務容器實例（啟用自動依賴解析），導入時創建，避免多線程下重複構造
+_global_container = create_enhanced_container()
 
 
 def get_container() -> ServiceContainer:
     """獲取全局服務容器實例"""
-    global _global_container
-    if _global_container is None:
-        _global_container = ServiceContainer()
-        # 啟用自動依賴解析
-        _global_container.enable_auto_resolution()
     return _global_container
 
 
@@ -49,11 +69,9 @@ def set_container(container: ServiceContainer):
     _global_container = container
 
 
-def create_enhanced_container() -> ServiceContainer:
-    """創建增強的服務容器"""
-    container = ServiceContainer()
-    container.enable_auto_resolution()
-    return container
+def reset_container():
+    """以新的增強服務容器替換全局實例（主要用於測試隔離）"""
+    set_container(create_enhanced_container())
 
 
 # 導出主要類和函數
@@ -80,8 +98,10 @@ __all__ = [
     "ConfigurationBasedContainerBuilder",
     "create_container_from_config",
     "create_container_from_file",
+    "LazyProxy",
     # 容器管理
     "get_container",
     "set_container",
+    "reset_container",
     "create_enhanced_container",
 ]
@@ -4,9 +4,15 @@
 根據配置文件動態註冊服務，支持靈活的服務配置和依賴注入。
 """
 
+import functools
+import heapq
 import importlib
+import inspect
+import keyword
 import logging
-from typing import Dict, Any, Type, Callable, List
+import sys
+from typing import Dict, Any, Type, Callable, List, NamedTuple, Optional, Tuple
+from .lazy_proxy import LazyProxy
 from .service_container import ServiceContainer, ServiceLifecycle
 from .service_config import (
     ContainerConfiguration,
@@ -17,14 +23,199 @@ from .service_config import (
 )
 
 
+# 字典查找未命中的標記
+_MISSING = object()
+
+# 服務作用域 -> 容器生命週期；作用域服務在這個實現中視為單例
+_SCOPE_TO_LIFECYCLE = {
+    ServiceScope.SINGLETON: ServiceLifecycle.SINGLETON,
+    ServiceScope.TRANSIENT: ServiceLifecycle.TRANSIENT,
+    ServiceScope.SCOPED: ServiceLifecycle.SINGLETON,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_impl(implementation: str) -> Tuple[Optional[Type], Optional[str]]:
+    """
+    導入實現類，返回 (類, None) 或 (None, 錯誤信息)
+
+    失敗結果同樣被緩存，避免重複嘗試導入不存在的模塊。
+    """
+    # 分割模塊和類名
+    if "." not in implementation:
+        return None, f"Invalid implementation format: {implementation}"
+    module_path, class_name = implementation.rsplit(".", 1)
+
+    try:
+        # 動態導入模塊（已導入的模塊直接從 sys.modules 獲取，不經過導入機制）
+        module = sys.modules.get(module_path)
+        if module is None:
+            module = importlib.import_module(module_path)
+    except ImportError as e:
+        return None, f"Cannot import module for '{implementation}': {e}"
+
+    try:
+        # 獲取類
+        service_class = getattr(module, class_name)
+    except AttributeError as e:
+        return None, f"Class not found in module for '{implementation}': {e}"
+
+    # type(x) is type 免去絕大多數情況下的MRO遍歷，isinstance 保留給自定義元類
+    if type(service_class) is not type and not isinstance(service_class, type):
+        return None, f"'{implementation}' is not a class"
+
+    return service_class, None
+
+
+def _preload_modules(implementations) -> None:
+    """
+    一次性導入所有實現路徑涉及的模塊
+
+    之後的類型解析只需查 sys.modules；導入失敗留到解析單個服務時按原格式報錯。
+    """
+    module_paths = {impl.rsplit(".", 1)[0] for impl in implementations if "." in impl}
+    for module_path in module_paths:
+        if module_path not in sys.modules:
+            try:
+                importlib.import_module(module_path)
+            except ImportError:
+                pass
+
+
+def _resolve_impl(implementation: str) -> Type:
+    """按點分路徑解析實現類（帶緩存）"""
+    service_class, error = _load_impl(implementation)
+    if error is not None:
+        raise ValueError(error)
+    return service_class
+
+
+@functools.lru_cache(maxsize=None)
+def _accepted_kwargs(service_type: Type) -> Optional[frozenset]:
+    """
+    獲取構造函數可接受的關鍵字參數名
+
+    Returns:
+        參數名集合；構造函數接受 **kwargs 或無法獲取簽名時返回 None（不過濾）
+    """
+    try:
+        parameters = inspect.signature(service_type).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    accepted = set()
+    for param in parameters:
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            return None
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            accepted.add(param.name)
+    return frozenset(accepted)
+
+
+def _compile_constructor_thunk(
+    service_name: str,
+    service_type: Type,
+    dep_plan: Tuple[Tuple[str, Optional[Type], bool, Any, Optional[Exception]], ...],
+    resolve: Callable,
+) -> Optional[Callable]:
+    """
+    為只有必需依賴的類服務生成專用的構造函數
+
+    生成的函數按固定順序解析依賴並直接以關鍵字參數調用構造函數，
+    不再在每次解析時遍歷依賴計劃。依賴名不是合法標識符時返回 None。
+
+    Args:
+        service_name: 服務名稱（用於錯誤信息和調試）
+        service_type: 服務類型
+        dep_plan: 依賴計劃，必須全部為已解析類型的必需依賴
+        resolve: 容器的 resolve 方法
+
+    Returns:
+        無參數的工廠函數，或 None
+    """
+    names = [dep[0] for dep in dep_plan]
+    if not all(name.isidentifier() and not keyword.iskeyword(name) for name in names):
+        return None
+
+    params = ["_resolve", "_T", "_ValueError"]
+    lines = []
+    args = []
+    bound = []
+    for i, (name, dep_type, _, _, _) in enumerate(dep_plan):
+        params += [f"_d{i}", f"_m{i}"]
+        bound += [
+            dep_type,
+            f"Cannot resolve required dependency '{name}' for service '{service_name}': ",
+        ]
+        lines += [
+            "    try:",
+            f"        _v{i} = _resolve(_d{i})",
+            "    except Exception as e:",
+            f"        raise _ValueError(_m{i} + str(e))",
+        ]
+        args.append(f"{name}=_v{i}")
+    lines.append(f"    return _T({', '.join(args)})")
+    src = f"def _factory({', '.join(params)}):\n" + "\n".join(lines) + "\n"
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, f"<factory:{service_name}>", "exec"), namespace)
+    return functools.partial(
+        namespace["_factory"], resolve, service_type, ValueError, *bound
+    )
+
+
+class RegistrationPlan(NamedTuple):
+    """
+    按優先級排序後的服務註冊計劃（結構數組形式）
+
+    各字段為按同一順序排列的並行元組，註冊循環直接按下標訪問，
+    無需反復讀取每個服務配置對象的屬性。
+    """
+
+    services: Tuple[ServiceConfiguration, ...]
+    names: Tuple[str, ...]
+    impls: Tuple[str, ...]
+    dep_types: Tuple[Tuple[str, ...], ...]
+
+
+def build_registration_plan(config: ContainerConfiguration) -> RegistrationPlan:
+    """根據容器配置構建註冊計劃"""
+    services = tuple(sorted(config.services, key=lambda s: s.priority, reverse=True))
+    return RegistrationPlan(
+        services=services,
+        names=tuple(s.name for s in services),
+        impls=tuple(s.implementation for s in services),
+        dep_types=tuple(tuple(d.type for d in s.dependencies) for s in services),
+    )
+
+
 class ConfigDrivenServiceRegistrar:
     """配置驅動的服務註冊器"""
 
+    __slots__ = (
+        "container",
+        "logger",
+        "_registered_services",
+        "_type_by_name",
+        "_service_instances",
+        "_factory_builders",
+    )
+
     def __init__(self, container: ServiceContainer):
         self.container = container
         self.logger = logging.getLogger(__name__)
         self._registered_services: Dict[str, Type] = {}
+        # 服務名稱 -> 預先解析的實現類型（註冊前一次性解析）
+        self._type_by_name: Dict[str, Type] = {}
         self._service_instances: Dict[str, Any] = {}
+        # 服務類型 -> 工廠構建方法，其他類型按類服務處理
+        self._factory_builders: Dict[ServiceType, Callable] = {
+            ServiceType.FACTORY: self._create_factory_service_factory,
+            ServiceType.INSTANCE: self._create_instance_service_factory,
+        }
 
     def register_from_configuration(self, config: ContainerConfiguration):
         """
@@ -33,50 +224,112 @@ class ConfigDrivenServiceRegistrar:
         Args:
             config: 容器配置
         """
+        self.register_from_plan(build_registration_plan(config))
+
+    def register_from_plan(self, plan: RegistrationPlan):
+        """
+        根據預先構建的註冊計劃註冊所有服務
+
+        Args:
+            plan: 註冊計劃
+        """
         self.logger.info("Starting configuration-driven service registration")
 
-        # 按優先級排序服務
-        services = sorted(config.services, key=lambda s: s.priority, reverse=True)
+        # 預先導入所有服務和依賴所在的模塊
+        _preload_modules(
+            plan.impls + tuple(t for types in plan.dep_types for t in types)
+        )
+
+        # 按依賴關係拓撲排序，並預先解析所有實現類型
+        ordered_services = self._plan_all(plan)
+        self._register_service_batch(ordered_services, "Dependency Order")
 
-        # 分階段註冊
-        self._register_services_by_phase(services)
+        self.logger.info(
+            "Registered %d services from configuration", len(plan.services)
+        )
+
+    def _plan_all(self, plan: RegistrationPlan) -> List[ServiceConfiguration]:
+        """
+        按依賴關係對服務進行拓撲排序（Kahn算法），並一次性解析實現類型
 
-        self.logger.info(f"Registered {len(services)} services from configuration")
+        依賴通過實現路徑匹配到其他服務；同一層級內保持優先級順序，
+        存在循環依賴的服務按優先級追加到末尾。
 
-    def _register_services_by_phase(self, services: List[ServiceConfiguration]):
-        """分階段註冊服務"""
+        Args:
+            plan: 註冊計劃
 
-        # 階段1：註冊無依賴的服務
-        no_dependency_services = [s for s in services if not s.dependencies]
-        self._register_service_batch(no_dependency_services, "Phase 1: No Dependencies")
+        Returns:
+            被依賴的服務排在前面的服務配置列表
+        """
+        names, impls = plan.names, plan.impls
+        count = len(names)
+        index_by_impl = {impl: i for i, impl in enumerate(impls)}
+        dependents: List[List[int]] = [[] for _ in range(count)]
+        indegree = [0] * count
+
+        for i, dep_types in enumerate(plan.dep_types):
+            for dep_type in dep_types:
+                j = index_by_impl.get(dep_type)
+                if j is not None and j != i:
+                    dependents[j].append(i)
+                    indegree[i] += 1
+
+        # 以優先級排序中的位置作為堆鍵，就緒服務中優先級高的先註冊
+        ready = [i for i, degree in enumerate(indegree) if degree == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for k in dependents[i]:
+                indegree[k] -= 1
+                if indegree[k] == 0:
+                    heapq.heappush(ready, k)
+
+        if len(order) < count:
+            remaining = [i for i, degree in enumerate(indegree) if degree > 0]
+            self.logger.warning(
+                "Circular dependencies among services: %s",
+                [names[i] for i in remaining],
+            )
+            order.extend(remaining)
+
+        type_by_name = self._type_by_name
+        for i in order:
+            try:
+                type_by_name[names[i]] = self._resolve_service_type(impls[i])
+            except ValueError as e:
+                self.logger.error("Failed to register service '%s': %s", names[i], e)
+                raise
 
-        # 階段2：註冊有依賴的服務
-        dependency_services = [s for s in services if s.dependencies]
-        self._register_service_batch(dependency_services, "Phase 2: With Dependencies")
+        services = plan.services
+        return [services[i] for i in order]
 
     def _register_service_batch(
         self, services: List[ServiceConfiguration], phase_name: str
     ):
         """批量註冊服務"""
-        self.logger.debug(f"Starting {phase_name}")
+        self.logger.debug("Starting %s", phase_name)
 
         for service_config in services:
             try:
                 self._register_single_service(service_config)
             except Exception as e:
                 self.logger.error(
-                    f"Failed to register service '{service_config.name}': {e}"
+                    "Failed to register service '%s': %s", service_config.name, e
                 )
                 raise
 
-        self.logger.debug(f"Completed {phase_name}")
+        self.logger.debug("Completed %s", phase_name)
 
     def _register_single_service(self, service_config: ServiceConfiguration):
         """註冊單個服務"""
-        self.logger.debug(f"Registering service: {service_config.name}")
+        self.logger.debug("Registering service: %s", service_config.name)
 
-        # 解析服務類型
-        service_type = self._resolve_service_type(service_config.implementation)
+        # 解析服務類型（通常已在規劃階段解析）
+        service_type = self._type_by_name.get(service_config.name)
+        if service_type is None:
+            service_type = self._resolve_service_type(service_config.implementation)
         self._registered_services[service_config.name] = service_type
 
         # 創建服務工廠
@@ -86,6 +339,8 @@ class ConfigDrivenServiceRegistrar:
         lifecycle = self._convert_scope_to_lifecycle(service_config.scope)
 
         if lifecycle == ServiceLifecycle.SINGLETON:
+            if service_config.lazy:
+                factory = self._create_lazy_factory(factory)
             self.container.register_singleton(service_type, factory)
         elif lifecycle == ServiceLifecycle.TRANSIENT:
             self.container.register_transient(service_type, factory)
@@ -96,91 +351,181 @@ class ConfigDrivenServiceRegistrar:
             self._service_instances[service_config.name] = instance
 
         self.logger.debug(
-            f"Successfully registered service: {service_config.name} as {lifecycle.value}"
+            "Successfully registered service: %s as %s",
+            service_config.name,
+            lifecycle.value,
         )
 
-    def _resolve_service_type(self, implementation: str) -> Type:
-        """解析服務類型"""
-        try:
-            # 分割模塊和類名
-            if "." in implementation:
-                module_path, class_name = implementation.rsplit(".", 1)
-            else:
-                raise ValueError(f"Invalid implementation format: {implementation}")
-
-            # 動態導入模塊
-            module = importlib.import_module(module_path)
-
-            # 獲取類
-            service_class = getattr(module, class_name)
+    @staticmethod
+    def _create_lazy_factory(factory: Callable) -> Callable:
+        """包裝工廠，返回在首次使用時才創建並初始化服務的代理"""
 
-            if not isinstance(service_class, type):
-                raise ValueError(f"'{implementation}' is not a class")
+        def create_target():
+            instance = factory()
+            # 容器對代理執行的初始化被推遲，在此對真實實例補上
+            initialize = getattr(instance, "initialize", None)
+            if callable(initialize):
+                initialize()
+            return instance
 
-            return service_class
+        return lambda: LazyProxy(create_target)
 
-        except ImportError as e:
-            raise ValueError(f"Cannot import module for '{implementation}': {e}")
-        except AttributeError as e:
-            raise ValueError(f"Class not found in module for '{implementation}': {e}")
+    def _resolve_service_type(self, implementation: str) -> Type:
+        """解析服務類型"""
+        return _resolve_impl(implementation)
 
     def _create_service_factory(
         self, service_config: ServiceConfiguration, service_type: Type
     ) -> Callable:
         """創建服務工廠函數"""
+        builder = self._factory_builders.get(
+            service_config.service_type, self._create_class_service_factory
+        )
+        return builder(service_config, service_type)
 
-        if service_config.service_type == ServiceType.FACTORY:
-            return self._create_factory_service_factory(service_config, service_type)
-        elif service_config.service_type == ServiceType.INSTANCE:
-            return self._create_instance_service_factory(service_config, service_type)
-        else:
-            return self._create_class_service_factory(service_config, service_type)
+    def _build_dependency_plan(
+        self, service_config: ServiceConfiguration
+    ) -> Tuple[Tuple[str, Optional[Type], bool, Any, Optional[Exception]], ...]:
+        """
+        在註冊時一次性解析依賴類型，生成依賴計劃
+
+        Returns:
+            (參數名, 依賴類型, 是否可選, 默認值, 類型解析錯誤) 元組
+        """
+        plan = []
+        for dependency in service_config.dependencies:
+            try:
+                dep_type, error = self._resolve_service_type(dependency.type), None
+            except ValueError as e:
+                # 延遲到實例化時再按可選/必需處理，與原有行為一致
+                dep_type, error = None, e
+            plan.append(
+                (
+                    dependency.name,
+                    dep_type,
+                    dependency.optional,
+                    dependency.default_value,
+                    error,
+                )
+            )
+        return tuple(plan)
 
     def _create_class_service_factory(
         self, service_config: ServiceConfiguration, service_type: Type
     ) -> Callable:
         """創建類服務工廠"""
+        dep_plan = self._build_dependency_plan(service_config)
+
+        # 只傳遞構造函數能接受的依賴，不再靠捕獲 TypeError 後無參重試
+        accepted = _accepted_kwargs(service_type)
+        if accepted is not None:
+            skipped = [dep[0] for dep in dep_plan if dep[0] not in accepted]
+            if skipped:
+                self.logger.debug(
+                    "Constructor of service %s does not accept %s, skipping",
+                    service_config.name,
+                    skipped,
+                )
+                dep_plan = tuple(dep for dep in dep_plan if dep[0] in accepted)
+        # 只有必需依賴且無需設置參數時，使用生成的專用構造函數
+        if not service_config.parameters and all(
+            not optional and error is None for _, _, optional, _, error in dep_plan
+        ):
+            thunk = _compile_constructor_thunk(
+                service_config.name, service_type, dep_plan, self.container.resolve
+            )
+            if thunk is not None:
+                return thunk
+
+        # 在構建計劃時對配置參數分類：可直接寫入實例 __dict__ 的、需要走 setattr 的、
+        # 以及類上不可見（通常在 __init__ 中賦值）需在首個實例上確認存在的
+        dict_params: Dict[str, Any] = {}
+        setattr_params: List[Tuple[str, Any]] = []
+        pending_params: List[Tuple[str, Any]] = []
+        has_instance_dict = any(
+            "__dict__" in vars(klass) for klass in service_type.__mro__
+        )
+        for param_name, param_value in service_config.parameters.items():
+            class_attr = inspect.getattr_static(service_type, param_name, _MISSING)
+            if class_attr is not _MISSING:
+                # 數據描述符（property、__slots__ 成員）必須通過 setattr 設置
+                if has_instance_dict and not hasattr(type(class_attr), "__set__"):
+                    dict_params[param_name] = param_value
+                else:
+                    setattr_params.append((param_name, param_value))
+            elif has_instance_dict:
+                pending_params.append((param_name, param_value))
+            else:
+                self.logger.warning(
+                    "Service %s does not have attribute '%s'",
+                    service_config.name,
+                    param_name,
+                )
+        resolve = self.container.resolve
+        can_resolve = self.container.can_resolve
+        logger = self.logger
 
         def factory():
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
             # 解析依賴
             kwargs = {}
 
-            for dependency in service_config.dependencies:
-                try:
-                    # 嘗試從容器解析依賴
-                    dep_type = self._resolve_service_type(dependency.type)
-                    dep_instance = self.container.resolve(dep_type)
-                    kwargs[dependency.name] = dep_instance
-                except Exception as e:
-                    if dependency.optional:
-                        if dependency.default_value is not None:
-                            kwargs[dependency.name] = dependency.default_value
-                        # 如果是可選依賴且沒有默認值，則跳過
-                    else:
-                        raise ValueError(
-                            f"Cannot resolve required dependency '{dependency.name}' for service '{service_config.name}': {e}"
-                        )
+            for dep_name, dep_type, optional, default_value, error in dep_plan:
+                # 可選依賴未註冊且無法自動解析時直接使用默認值，不走異常路徑
+                if optional and (error is not None or not can_resolve(dep_type)):
+                    if default_value is not None:
+                        kwargs[dep_name] = default_value
+                    # 如果是可選依賴且沒有默認值，則跳過
+                    continue
+
+                if error is None:
+                    try:
+                        # 從容器解析依賴
+                        kwargs[dep_name] = resolve(dep_type)
+                        continue
+                    except Exception as e:
+                        error = e
+
+                if optional:
+                    # 可選依賴解析失敗時，與原有行為一致使用默認值
+                    if default_value is not None:
+                        kwargs[dep_name] = default_value
+                    continue
+
+                raise ValueError(
+                    f"Cannot resolve required dependency '{dep_name}' for service '{service_config.name}': {error}"
+                )
 
             # 創建服務實例
-            try:
-                instance = service_type(**kwargs)
-            except TypeError as e:
-                # 如果構造函數不接受參數，嘗試不帶參數創建
-                if "unexpected keyword argument" in str(e):
-                    instance = service_type()
-                else:
-                    raise
+            instance = service_type(**kwargs)
+
+            # 首個實例創建後確認待定參數是否存在，缺失的只警告一次
+            if pending_params:
+                for param_name, param_value in pending_params:
+                    if hasattr(instance, param_name):
+                        dict_params[param_name] = param_value
+                    else:
+                        logger.warning(
+                            "Service %s does not have attribute '%s'",
+                            service_config.name,
+                            param_name,
+                        )
+                pending_params.clear()
 
             # 在創建後設置配置參數
-            for param_name, param_value in service_config.parameters.items():
-                if hasattr(instance, param_name):
-                    setattr(instance, param_name, param_value)
-                    self.logger.debug(
-                        f"Set parameter {param_name}={param_value} for service {service_config.name}"
-                    )
-                else:
-                    self.logger.warning(
-                        f"Service {service_config.name} does not have attribute '{param_name}'"
+            if dict_params:
+                instance.__dict__.update(dict_params)
+            for param_name, param_value in setattr_params:
+                setattr(instance, param_name, param_value)
+
+            if debug_enabled:
+                for param_name, param_value in (*dict_params.items(), *setattr_params):
+                    logger.debug(
+                        "Set parameter %s=%s for service %s",
+                        param_name,
+                        param_value,
+                        service_config.name,
                     )
 
             return instance
@@ -191,6 +536,9 @@ class ConfigDrivenServiceRegistrar:
         self, service_config: ServiceConfiguration, service_type: Type
     ) -> Callable:
         """創建工廠服務工廠"""
+        dep_plan = self._build_dependency_plan(service_config)
+        resolve = self.container.resolve
+        can_resolve = self.container.can_resolve
 
         def factory():
             # 對於工廠類型，service_type應該是一個工廠函數
@@ -200,16 +548,23 @@ class ConfigDrivenServiceRegistrar:
             kwargs = service_config.parameters.copy()
 
             # 解析依賴並添加到參數中
-            for dependency in service_config.dependencies:
-                try:
-                    dep_type = self._resolve_service_type(dependency.type)
-                    dep_instance = self.container.resolve(dep_type)
-                    kwargs[dependency.name] = dep_instance
-                except Exception as e:
-                    if not dependency.optional:
-                        raise ValueError(
-                            f"Cannot resolve dependency '{dependency.name}': {e}"
-                        )
+            for dep_name, dep_type, optional, _, error in dep_plan:
+                # 可選依賴未註冊且無法自動解析時直接跳過，不走異常路徑
+                if optional and (error is not None or not can_resolve(dep_type)):
+                    continue
+
+                if error is None:
+                    try:
+                        kwargs[dep_name] = resolve(dep_type)
+                        continue
+                    except Exception as e:
+                        error = e
+
+                if optional:
+                    # 可選依賴解析失敗時，與原有行為一致跳過
+                    continue
+
+                raise ValueError(f"Cannot resolve dependency '{dep_name}': {error}")
 
             return factory_func(**kwargs)
 
@@ -219,11 +574,14 @@ class ConfigDrivenServiceRegistrar:
         self, service_config: ServiceConfiguration, service_type: Type
     ) -> Callable:
         """創建實例服務工廠"""
+        instances = self._service_instances
+        name = service_config.name
 
         def factory():
             # 對於實例類型，直接返回預創建的實例
-            if service_config.name in self._service_instances:
-                return self._service_instances[service_config.name]
+            instance = instances.get(name, _MISSING)
+            if instance is not _MISSING:
+                return instance
 
             # 如果沒有預創建，則創建新實例
             kwargs = service_config.parameters.copy()
@@ -233,15 +591,7 @@ class ConfigDrivenServiceRegistrar:
 
     def _convert_scope_to_lifecycle(self, scope: ServiceScope) -> ServiceLifecycle:
         """轉換作用域到生命週期"""
-        if scope == ServiceScope.SINGLETON:
-            return ServiceLifecycle.SINGLETON
-        elif scope == ServiceScope.TRANSIENT:
-            return ServiceLifecycle.TRANSIENT
-        elif scope == ServiceScope.SCOPED:
-            # 對於作用域服務，在這個實現中視為單例
-            return ServiceLifecycle.SINGLETON
-        else:
-            return ServiceLifecycle.SINGLETON
+        return _SCOPE_TO_LIFECYCLE.get(scope, ServiceLifecycle.SINGLETON)
 
     def get_registered_service_types(self) -> Dict[str, Type]:
         """獲取已註冊的服務類型"""
@@ -282,9 +632,9 @@ class ConfigurationBasedContainerBuilder:
         # 設置日誌級別
         logging.getLogger().setLevel(getattr(logging, config.logging_level.upper()))
 
-        # 創建註冊器並註冊服務
+        # 在構建器邊界將配置轉換為註冊計劃，再交給註冊器
         registrar = ConfigDrivenServiceRegistrar(container)
-        registrar.register_from_configuration(config)
+        registrar.register_from_plan(build_registration_plan(config))
 
         self.logger.info("Container built successfully from configuration")
         return container
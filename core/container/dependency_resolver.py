@@ -6,19 +6,73 @@
 
 import inspect
 import logging
-from typing import Dict, Type, TypeVar, Set, List, get_type_hints
+import threading
+from typing import Any, Dict, Type, TypeVar, List, Tuple, get_type_hints
 from .service_container import ServiceContainer
 
 T = TypeVar("T")
 
+_EMPTY = inspect.Parameter.empty
+
+# 服務未註冊的標記
+_MISSING = object()
+
+# 循環檢測中節點的訪問狀態
+_IN_PROGRESS = 1
+_DONE = 2
+
+# 構造函數參數描述：(參數名, 類型提示或None, 是否有默認值, 默認值)
+ParamSpec = Tuple[str, Any, bool, Any]
+
 
 class DependencyResolver:
     """依賴解析器 - 提供自動依賴注入功能"""
 
+    __slots__ = ("container", "logger", "_tls", "_sig_cache")
+
     def __init__(self, container: ServiceContainer):
         self.container = container
         self.logger = logging.getLogger(__name__)
-        self._resolving_stack: Set[Type] = set()  # 用於檢測循環依賴
+        # 每個線程獨立的解析棧，用於檢測循環依賴
+        self._tls = threading.local()
+        # 服務類型 -> (構造函數簽名, 類型提示, 參數描述)，避免重複內省
+        self._sig_cache: Dict[
+            Type, Tuple[inspect.Signature, Dict[str, Any], Tuple[ParamSpec, ...]]
+        ] = {}
+
+    def _introspect(
+        self, service_type: Type
+    ) -> Tuple[inspect.Signature, Dict[str, Any], Tuple[ParamSpec, ...]]:
+        """
+        獲取服務類型構造函數的簽名、類型提示和參數描述（按類型緩存）
+
+        Args:
+            service_type: 服務類型
+
+        Returns:
+            (簽名, 類型提示, 跳過self後的參數描述元組)
+        """
+        cached = self._sig_cache.get(service_type)
+        if cached is None:
+            constructor = service_type.__init__
+            signature = inspect.signature(constructor)
+            # 先用原始註解；只有存在字符串形式的前向引用時才調用較慢的 get_type_hints
+            type_hints = getattr(constructor, "__annotations__", None) or {}
+            if any(isinstance(hint, str) for hint in type_hints.values()):
+                type_hints = get_type_hints(constructor)
+            params = tuple(
+                (
+                    name,
+                    type_hints.get(name),
+                    param.default is not _EMPTY,
+                    param.default,
+                )
+                for name, param in signature.parameters.items()
+                if name != "self"
+            )
+            cached = (signature, type_hints, params)
+            self._sig_cache[service_type] = cached
+        return cached
 
     def auto_resolve(self, service_type: Type[T]) -> T:
         """
@@ -33,26 +87,37 @@ class DependencyResolver:
         Raises:
             ValueError: 如果發現循環依賴或無法解析依賴
         """
+        # 當前線程的解析棧：(按順序的類型列表, id(類型) -> 棧中位置)
+        state = getattr(self._tls, "stack", None)
+        if state is None:
+            state = self._tls.stack = ([], {})
+        stack, positions = state
+
         # 檢查循環依賴
-        if service_type in self._resolving_stack:
+        key = id(service_type)
+        if key in positions:
             cycle_path = (
-                " -> ".join([t.__name__ for t in self._resolving_stack])
+                " -> ".join([t.__name__ for t in stack[positions[key] :]])
                 + f" -> {service_type.__name__}"
             )
             raise ValueError(f"Circular dependency detected: {cycle_path}")
 
         # 如果服務已經註冊，直接解析
-        if self.container.is_registered(service_type):
-            return self.container.resolve(service_type)
+        container = self.container
+        instance = container.resolve_or_none(service_type, _MISSING)
+        if instance is not _MISSING:
+            return instance
 
         # 自動註冊和解析
-        self._resolving_stack.add(service_type)
+        positions[key] = len(stack)
+        stack.append(service_type)
         try:
             instance = self._create_instance_with_dependencies(service_type)
-            self.container.register_instance(service_type, instance)
+            container.register_instance(service_type, instance)
             return instance
         finally:
-            self._resolving_stack.remove(service_type)
+            stack.pop()
+            del positions[key]
 
     def _create_instance_with_dependencies(self, service_type: Type[T]) -> T:
         """
@@ -64,26 +129,16 @@ class DependencyResolver:
         Returns:
             服務實例
         """
-        # 獲取構造函數簽名
-        constructor = service_type.__init__
-        signature = inspect.signature(constructor)
-
-        # 獲取類型提示
-        type_hints = get_type_hints(constructor)
+        # 獲取構造函數參數描述（已緩存）
+        _, _, params = self._introspect(service_type)
 
         # 準備構造函數參數
         kwargs = {}
 
-        for param_name, param in signature.parameters.items():
-            if param_name == "self":
-                continue
-
-            # 獲取參數類型
-            param_type = type_hints.get(param_name)
-
+        for param_name, param_type, has_default, _ in params:
             if param_type is None:
                 # 如果沒有類型提示，嘗試從默認值推斷
-                if param.default != inspect.Parameter.empty:
+                if has_default:
                     continue  # 使用默認值
                 else:
                     raise ValueError(
@@ -95,10 +150,13 @@ class DependencyResolver:
                 dependency = self.auto_resolve(param_type)
                 kwargs[param_name] = dependency
                 self.logger.debug(
-                    f"Resolved dependency {param_name}: {param_type.__name__} for {service_type.__name__}"
+                    "Resolved dependency %s: %s for %s",
+                    param_name,
+                    param_type.__name__,
+                    service_type.__name__,
                 )
             except Exception as e:
-                if param.default != inspect.Parameter.empty:
+                if has_default:
                     # 如果有默認值，使用默認值
                     continue
                 else:
@@ -109,9 +167,12 @@ class DependencyResolver:
         # 創建實例
         try:
             instance = service_type(**kwargs)
-            self.logger.debug(
-                f"Created instance of {service_type.__name__} with dependencies: {list(kwargs.keys())}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Created instance of %s with dependencies: %s",
+                    service_type.__name__,
+                    list(kwargs.keys()),
+                )
             return instance
         except Exception as e:
             raise ValueError(
@@ -129,32 +190,30 @@ class DependencyResolver:
             依賴圖字典
         """
         graph = {}
-        visited = set()
-
-        def build_graph(current_type: Type):
-            if current_type in visited:
-                return
-
-            visited.add(current_type)
-            dependencies = []
-
-            # 獲取構造函數依賴
-            constructor = current_type.__init__
-            signature = inspect.signature(constructor)
-            type_hints = get_type_hints(constructor)
-
-            for param_name, param in signature.parameters.items():
-                if param_name == "self":
-                    continue
-
-                param_type = type_hints.get(param_name)
-                if param_type and param.default == inspect.Parameter.empty:
+        visited = {service_type}
+
+        # 熱循環中使用的方法綁定到局部變量
+        introspect = self._introspect
+        visited_add = visited.add
+
+        # 顯式棧迭代深度優先遍歷：(類型, 未處理的構造函數參數, 已收集的依賴)
+        stack = [(service_type, iter(introspect(service_type)[2]), [])]
+        stack_push = stack.append
+        stack_pop = stack.pop
+        while stack:
+            current_type, params, dependencies = stack[-1]
+            for _, param_type, has_default, _ in params:
+                if param_type and not has_default:
                     dependencies.append(param_type.__name__)
-                    build_graph(param_type)
+                    if param_type not in visited:
+                        # 先處理子依賴，完成後回到當前類型繼續
+                        visited_add(param_type)
+                        stack_push((param_type, iter(introspect(param_type)[2]), []))
+                        break
+            else:
+                stack_pop()
+                graph[current_type.__name__] = dependencies
 
-            graph[current_type.__name__] = dependencies
-
-        build_graph(service_type)
         return graph
 
     def validate_dependencies(self, service_types: List[Type]) -> List[str]:
@@ -195,30 +254,33 @@ class DependencyResolver:
         Returns:
             True如果存在循環依賴
         """
-        # 使用深度優先搜索檢測循環
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node: str) -> bool:
-            if node in rec_stack:
-                return True  # 發現循環
+        # 使用迭代深度優先搜索檢測循環
+        color: Dict[str, int] = {}
 
-            if node in visited:
-                return False
+        # 熱循環中使用的方法綁定到局部變量
+        color_get = color.get
+        graph_get = graph.get
 
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph.get(node, []):
-                if dfs(neighbor):
-                    return True
-
-            rec_stack.remove(node)
-            return False
+        for root in graph:
+            if root in color:
+                continue
 
-        for node in graph:
-            if node not in visited:
-                if dfs(node):
-                    return True
+            color[root] = _IN_PROGRESS
+            stack = [(root, iter(graph_get(root, ())))]
+            stack_push = stack.append
+            stack_pop = stack.pop
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    state = color_get(neighbor)
+                    if state == _IN_PROGRESS:
+                        return True  # 發現循環
+                    if state is None:
+                        color[neighbor] = _IN_PROGRESS
+                        stack_push((neighbor, iter(graph_get(neighbor, ()))))
+                        break
+                else:
+                    color[node] = _DONE
+                    stack_pop()
 
         return False
@@ -0,0 +1,58 @@
+"""
+延遲初始化代理
+
+在首次訪問屬性時才創建目標對象，用於推遲構建開銷較大的單例服務。
+"""
+
+from typing import Any, Callable
+
+# 目標對象尚未創建的標記
+_UNINITIALIZED = object()
+
+
+class LazyProxy:
+    """
+    延遲創建目標對象的代理
+
+    屬性讀寫和刪除都會轉發到目標對象，目標在首次訪問時通過工廠函數創建。
+    特殊方法（如 __len__、__call__）不經過 __getattr__，不會被代理。
+    """
+
+    __slots__ = ("_factory", "_instance", "__weakref__")
+
+    # 生命週期管理器探測的鉤子：目標創建前返回None，避免僅因探測而提前創建目標
+    _DEFERRED_HOOKS = frozenset({"initialize", "dispose"})
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", _UNINITIALIZED)
+
+    def _get_instance(self) -> Any:
+        """獲取目標對象，必要時創建"""
+        instance = object.__getattribute__(self, "_instance")
+        if instance is _UNINITIALIZED:
+            instance = object.__getattribute__(self, "_factory")()
+            object.__setattr__(self, "_instance", instance)
+            object.__setattr__(self, "_factory", None)
+        return instance
+
+    @property
+    def is_initialized(self) -> bool:
+        """目標對象是否已創建"""
+        return object.__getattribute__(self, "_instance") is not _UNINITIALIZED
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyProxy._DEFERRED_HOOKS and not self.is_initialized:
+            return None
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_instance(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get_instance(), name)
+
+    def __repr__(self) -> str:
+        if not self.is_initialized:
+            return "<LazyProxy (uninitialized)>"
+        return f"<LazyProxy {self._get_instance()!r}>"
@@ -6,11 +6,20 @@
 
 import json
 import logging
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, field
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 
+# orjson 為可選依賴，可用時解析和序列化速度更快
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ServiceScope(Enum):
     """服務作用域"""
@@ -29,7 +38,38 @@ class ServiceType(Enum):
     INTERFACE = "interface"
 
 
-@dataclass
+# 常見的外部依賴（不需要在配置中定義）
+_EXTERNAL_DEPENDENCIES = frozenset(
+    {
+        "root",  # tkinter.Tk 實例
+        "ui",  # 可能是別名
+        "state_manager",  # 可能是別名
+        "file_service",  # 可能是別名
+        "translation_service",  # 可能是別名
+        "highlighting_service",  # 可能是別名
+        "project_service",  # 可能是別名
+    }
+)
+
+# 已解析的配置文件緩存，鍵為 (絕對路徑, 修改時間, 文件大小)
+_FILE_CACHE: Dict[Tuple[str, int, int], "ContainerConfiguration"] = {}
+
+
+def clear_file_cache():
+    """清空配置文件緩存"""
+    _FILE_CACHE.clear()
+
+
+def _enum_aware_dict(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """asdict 的 dict_factory：枚舉轉為其值，並略過私有字段"""
+    return {
+        key: value.value if isinstance(value, Enum) else value
+        for key, value in items
+        if not key.startswith("_")
+    }
+
+
+@dataclass(slots=True)
 class ServiceDependency:
     """服務依賴配置"""
 
@@ -38,8 +78,15 @@ class ServiceDependency:
     optional: bool = False
     default_value: Any = None
 
+    # 類型的最後一段（類名），構建時計算一次
+    _type_leaf: str = field(default="", init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        """計算類型名稱"""
+        self._type_leaf = self.type.rsplit(".", 1)[-1]
+
+
+@dataclass(slots=True)
 class ServiceConfiguration:
     """單個服務配置"""
 
@@ -53,13 +100,23 @@ class ServiceConfiguration:
     enabled: bool = True
     priority: int = 0
     tags: List[str] = field(default_factory=list)
+    lazy: bool = False  # 單例服務是否延遲到首次使用時才創建
+
+    # 實現路徑的最後一段（類名），構建時計算一次
+    _impl_leaf: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """後處理，確保枚舉類型正確"""
+        """後處理，確保枚舉類型正確並計算實現類名"""
         if isinstance(self.scope, str):
             self.scope = ServiceScope(self.scope)
         if isinstance(self.service_type, str):
             self.service_type = ServiceType(self.service_type)
+        self._impl_leaf = self.implementation.rsplit(".", 1)[-1]
+
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """轉換為字典（每次按當前字段值生成）"""
+        return asdict(self, dict_factory=_enum_aware_dict)
 
 
 @dataclass
@@ -73,6 +130,28 @@ class ContainerConfiguration:
     logging_level: str = "INFO"
     validation_enabled: bool = True
 
+    # 驗證結果緩存，以配置內容簽名為鍵
+    _validation_signature: Optional[Tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validation_cache: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # 已啟用服務及其名稱與標籤索引，首次使用時構建；索引依據的內容變化時重建
+    _enabled_services: List[ServiceConfiguration] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _by_name: Optional[Dict[str, ServiceConfiguration]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _by_tag: Optional[Dict[str, List[ServiceConfiguration]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _index_key: Optional[Tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ContainerConfiguration":
         """從字典創建配置"""
@@ -89,14 +168,16 @@ class ContainerConfiguration:
             service_config = ServiceConfiguration(
                 name=service_data["name"],
                 implementation=service_data["implementation"],
-                scope=ServiceScope(service_data.get("scope", "singleton")),
-                service_type=ServiceType(service_data.get("service_type", "class")),
+                # 枚舉轉換由 __post_init__ 統一完成
+                scope=service_data.get("scope", "singleton"),
+                service_type=service_data.get("service_type", "class"),
                 dependencies=dependencies,
                 parameters=service_data.get("parameters", {}),
                 interfaces=service_data.get("interfaces", []),
                 enabled=service_data.get("enabled", True),
                 priority=service_data.get("priority", 0),
                 tags=service_data.get("tags", []),
+                lazy=service_data.get("lazy", False),
             )
             services.append(service_config)
 
@@ -113,47 +194,40 @@ class ContainerConfiguration:
 
     @classmethod
     def from_json_file(cls, file_path: Union[str, Path]) -> "ContainerConfiguration":
-        """從JSON文件加載配置"""
+        """從JSON文件加載配置（文件未變更時返回緩存的配置）"""
         path = Path(file_path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
+        cache_key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _FILE_CACHE.get(cache_key)
+        if cached is not None and type(cached) is cls:
+            return cached
+
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return cls.from_dict(data)
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(path.read_bytes())
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            config = cls.from_dict(data)
+            # 同一文件只保留最新版本
+            for stale_key in [key for key in _FILE_CACHE if key[0] == cache_key[0]]:
+                del _FILE_CACHE[stale_key]
+            _FILE_CACHE[cache_key] = config
+            return config
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
             raise ValueError(f"Error loading configuration: {e}")
 
     def to_dict(self) -> Dict[str, Any]:
-        """轉換為字典"""
+        """轉換為字典（每次返回新的字典和服務列表）"""
+        self._ensure_indexes()
         return {
-            "services": [
-                {
-                    "name": service.name,
-                    "implementation": service.implementation,
-                    "scope": service.scope.value,
-                    "service_type": service.service_type.value,
-                    "dependencies": [
-                        {
-                            "name": dep.name,
-                            "type": dep.type,
-                            "optional": dep.optional,
-                            "default_value": dep.default_value,
-                        }
-                        for dep in service.dependencies
-                    ],
-                    "parameters": service.parameters,
-                    "interfaces": service.interfaces,
-                    "enabled": service.enabled,
-                    "priority": service.priority,
-                    "tags": service.tags,
-                }
-                for service in self.services
-                if service.enabled
-            ],
+            "services": [service.as_dict for service in self._enabled_services],
             "auto_registration": self.auto_registration,
             "circular_dependency_detection": self.circular_dependency_detection,
             "lifecycle_management": self.lifecycle_management,
@@ -166,146 +240,218 @@ class ContainerConfiguration:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if ORJSON_AVAILABLE:
+            path.write_bytes(
+                orjson.dumps(
+                    self.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
+
         with open(path, "w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
 
+    def _compute_index_key(self) -> Tuple:
+        """計算影響已啟用服務索引的內容簽名（服務對象、名稱、啟用狀態與標籤）"""
+        return tuple((id(s), s.name, s.enabled, tuple(s.tags)) for s in self.services)
+
+    def _ensure_indexes(self):
+        """按需構建已啟用服務列表及其名稱與標籤索引"""
+        index_key = self._compute_index_key()
+        if self._index_key == index_key:
+            return
+
+        enabled_services = [service for service in self.services if service.enabled]
+        by_name: Dict[str, ServiceConfiguration] = {}
+        by_tag: Dict[str, List[ServiceConfiguration]] = {}
+        for service in enabled_services:
+            # 同名服務保留第一個
+            by_name.setdefault(service.name, service)
+            for tag in service.tags:
+                by_tag.setdefault(tag, []).append(service)
+
+        self._enabled_services = enabled_services
+        self._by_name = by_name
+        self._by_tag = by_tag
+        self._index_key = index_key
+
     def get_services_by_tag(self, tag: str) -> List[ServiceConfiguration]:
         """根據標籤獲取服務"""
-        return [
-            service
-            for service in self.services
-            if tag in service.tags and service.enabled
-        ]
+        self._ensure_indexes()
+        return list(self._by_tag.get(tag, ()))
 
     def get_service_by_name(self, name: str) -> Optional[ServiceConfiguration]:
         """根據名稱獲取服務"""
-        for service in self.services:
-            if service.name == name and service.enabled:
-                return service
-        return None
+        self._ensure_indexes()
+        return self._by_name.get(name)
+
+    def _compute_signature(self) -> Tuple:
+        """計算影響驗證結果的配置內容簽名"""
+        return (
+            self.circular_dependency_detection,
+            tuple(
+                (
+                    s.name,
+                    s.implementation,
+                    tuple((d.name, d.type, d.optional) for d in s.dependencies),
+                    s.enabled,
+                )
+                for s in self.services
+            ),
+        )
 
     def validate(self) -> List[str]:
-        """驗證配置"""
+        """驗證配置（配置內容未變時返回緩存的結果）"""
+        signature = self._compute_signature()
+        if (
+            self._validation_cache is not None
+            and signature == self._validation_signature
+        ):
+            return list(self._validation_cache)
+
+        errors = self._validate()
+        self._validation_signature = signature
+        self._validation_cache = errors
+        return list(errors)
+
+    def _validate(self) -> List[str]:
+        """執行完整的配置驗證"""
         errors = []
 
+        self._ensure_indexes()
+        enabled_services = self._enabled_services
+
         # 檢查服務名稱唯一性
-        names = [service.name for service in self.services if service.enabled]
-        duplicates = set([name for name in names if names.count(name) > 1])
+        names = [service.name for service in enabled_services]
+        duplicates = {name for name, count in Counter(names).items() if count > 1}
         if duplicates:
             errors.append(f"Duplicate service names: {', '.join(duplicates)}")
 
-        # 檢查依賴是否存在
-        service_names = set(names)
-        # 添加常見的外部依賴（不需要在配置中定義）
-        external_dependencies = {
-            "root",  # tkinter.Tk 實例
-            "ui",  # 可能是別名
-            "state_manager",  # 可能是別名
-            "file_service",  # 可能是別名
-            "translation_service",  # 可能是別名
-            "highlighting_service",  # 可能是別名
-            "project_service",  # 可能是別名
-        }
-
-        # 建立服務名稱到類型的映射
-        service_type_mapping = {}
-        for service in self.services:
-            if service.enabled:
-                # 使用類名作為可能的依賴名稱
-                class_name = service.implementation.split(".")[-1]
-                service_type_mapping[class_name] = service.name
-                service_type_mapping[service.name.lower()] = service.name
-
-        for service in self.services:
-            if not service.enabled:
-                continue
-
-            for dependency in service.dependencies:
-                dep_name = dependency.name
-
-                # 跳過可選依賴
-                if dependency.optional:
-                    continue
+        # 單次遍歷依賴圖，同時檢查依賴是否存在和循環依賴
+        unresolved, cycles = self._analyze_graph()
+        errors.extend(unresolved)
 
-                # 跳過外部依賴
-                if dep_name in external_dependencies:
-                    continue
-
-                # 檢查直接名稱匹配
-                if dep_name in service_names:
-                    continue
+        if self.circular_dependency_detection and cycles:
+            errors.extend(
+                [
+                    f"Circular dependency detected: {' -> '.join(cycle)}"
+                    for cycle in cycles
+                ]
+            )
 
-                # 檢查類型映射
-                if dep_name in service_type_mapping:
-                    continue
+        return errors
 
-                # 檢查是否是類型名稱
-                dep_type = (
-                    dependency.type.split(".")[-1]
-                    if "." in dependency.type
-                    else dependency.type
-                )
-                if dep_type in [
-                    s.implementation.split(".")[-1] for s in self.services if s.enabled
-                ]:
-                    continue
+    def _analyze_graph(self) -> Tuple[List[str], List[List[str]]]:
+        """
+        遍歷已啟用服務的必需依賴圖，檢查未解析的依賴並收集循環依賴
+
+        Returns:
+            (未解析依賴的錯誤信息, 循環依賴列表)
+        """
+        enabled_services = self._enabled_services
+
+        # 可作為依賴名稱的服務名、類名和小寫服務名，以及依賴圖
+        known_names = set(_EXTERNAL_DEPENDENCIES)
+        impl_leafnames = set()
+        graph: Dict[str, List[ServiceDependency]] = {}
+        owners: Dict[str, ServiceConfiguration] = {}
+        shadowed: List[ServiceConfiguration] = []
+        for service in enabled_services:
+            impl_leafnames.add(service._impl_leaf)
+            known_names.add(service.name)
+            known_names.add(service._impl_leaf)
+            known_names.add(service.name.lower())
+            # 同名服務以最後一個為準，被覆蓋的只檢查依賴是否存在
+            if service.name in owners:
+                shadowed.append(owners[service.name])
+            owners[service.name] = service
+            graph[service.name] = [
+                dep for dep in service.dependencies if not dep.optional
+            ]
 
-                # 如果都不匹配，則記錄錯誤
-                errors.append(
+        # 服務 id -> 未解析依賴的錯誤信息，最後按服務順序輸出
+        unresolved: Dict[int, List[str]] = {}
+
+        def check_dependency(
+            service: ServiceConfiguration, dependency: ServiceDependency
+        ):
+            if (
+                dependency.name not in known_names
+                and dependency._type_leaf not in impl_leafnames
+            ):
+                unresolved.setdefault(id(service), []).append(
                     f"Service '{service.name}' has unresolved dependency: '{dependency.name}' (type: {dependency.type})"
                 )
 
-        # 檢查循環依賴
-        if self.circular_dependency_detection:
-            circular_deps = self._detect_circular_dependencies()
-            if circular_deps:
-                errors.extend(
-                    [
-                        f"Circular dependency detected: {' -> '.join(cycle)}"
-                        for cycle in circular_deps
-                    ]
-                )
-
-        return errors
-
-    def _detect_circular_dependencies(self) -> List[List[str]]:
-        """檢測循環依賴"""
-        # 構建依賴圖
-        graph = {}
-        for service in self.services:
-            if service.enabled:
-                graph[service.name] = [
-                    dep.name for dep in service.dependencies if not dep.optional
-                ]
-
-        # 使用DFS檢測循環
-        visited = set()
-        rec_stack = set()
+        for service in shadowed:
+            for dependency in service.dependencies:
+                if not dependency.optional:
+                    check_dependency(service, dependency)
+
+        # 迭代式 Tarjan 強連通分量算法，每個循環只報告一次
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        self_loops = set()
+        scc_stack: List[str] = []
         cycles = []
 
-        def dfs(node: str, path: List[str]):
-            if node in rec_stack:
-                # 找到循環
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:] + [node])
-                return
-
-            if node in visited:
-                return
-
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph.get(node, []):
-                dfs(neighbor, path + [node])
-
-            rec_stack.remove(node)
-
-        for service_name in graph:
-            if service_name not in visited:
-                dfs(service_name, [])
+        for root in graph:
+            if root in index:
+                continue
 
-        return cycles
+            index[root] = lowlink[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
+
+            while work:
+                node, dependencies = work[-1]
+                for dependency in dependencies:
+                    check_dependency(owners[node], dependency)
+
+                    neighbor = dependency.name
+                    # 未配置（或已禁用）的服務不可能構成循環
+                    if neighbor not in graph:
+                        continue
+                    if neighbor == node:
+                        self_loops.add(node)
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(graph[neighbor])))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    # 所有依賴已處理完，回溯
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+
+                        # 多於一個節點或自依賴的分量即為循環
+                        if len(component) > 1 or node in self_loops:
+                            component.reverse()
+                            cycles.append(component + [component[0]])
+
+        errors = [
+            error
+            for service in enabled_services
+            for error in unresolved.get(id(service), ())
+        ]
+        return errors, cycles
 
 
 class ServiceConfigurationManager:
@@ -332,11 +478,11 @@ class ServiceConfigurationManager:
                     )
 
             self._configurations[name] = config
-            self.logger.info(f"Loaded configuration '{name}' from {file_path}")
+            self.logger.info("Loaded configuration '%s' from %s", name, file_path)
             return config
 
         except Exception as e:
-            self.logger.error(f"Failed to load configuration '{name}': {e}")
+            self.logger.error("Failed to load configuration '%s': %s", name, e)
             raise
 
     def get_configuration(self, name: str) -> Optional[ContainerConfiguration]:
@@ -348,7 +494,7 @@ class ServiceConfigurationManager:
         if name not in self._configurations:
             raise ValueError(f"Configuration '{name}' not found")
         self._active_config = name
-        self.logger.info(f"Set active configuration to '{name}'")
+        self.logger.info("Set active configuration to '%s'", name)
 
     def get_active_configuration(self) -> Optional[ContainerConfiguration]:
         """獲取活動配置"""
@@ -433,13 +579,10 @@ class ServiceConfigurationManager:
         )
 
 
-# 全局配置管理器實例
-_config_manager = None
+# 全局配置管理器實例，導入時創建，避免多線程下重複構造
+_config_manager = ServiceConfigurationManager()
 
 
 def get_config_manager() -> ServiceConfigurationManager:
     """獲取全局配置管理器實例"""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ServiceConfigurationManager()
     return _config_manager
@@ -4,7 +4,7 @@
 提供服務註冊、解析和生命週期管理功能。
 """
 
-from typing import Dict, Any, Type, TypeVar, Callable, Optional, List
+from typing import Dict, Any, Type, TypeVar, Callable, List
 from abc import ABC, abstractmethod
 import logging
 from enum import Enum
@@ -12,6 +12,9 @@ from .service_lifecycle import get_lifecycle_manager, ServiceLifecycleManager
 
 T = TypeVar("T")
 
+# 字典查找未命中的標記
+_MISSING = object()
+
 
 class ServiceLifecycle(Enum):
     """服務生命週期枚舉"""
@@ -24,6 +27,8 @@ class ServiceLifecycle(Enum):
 class ServiceRegistration:
     """服務註冊信息"""
 
+    __slots__ = ("factory", "lifecycle")
+
     def __init__(self, factory: Callable, lifecycle: ServiceLifecycle):
         self.factory = factory
         self.lifecycle = lifecycle
@@ -72,6 +77,15 @@ class ServiceContainer(IServiceContainer):
         self._lifecycle_manager = get_lifecycle_manager()
         self._dependency_resolver = None  # 延遲初始化避免循環導入
 
+        # 生命週期 -> 解析處理函數
+        self._lifecycle_handlers: Dict[
+            ServiceLifecycle, Callable[[Type, ServiceRegistration], Any]
+        ] = {
+            ServiceLifecycle.SINGLETON: self._resolve_singleton,
+            ServiceLifecycle.TRANSIENT: self._resolve_transient,
+            ServiceLifecycle.INSTANCE: self._resolve_instance,
+        }
+
         self.logger.info("ServiceContainer initialized")
 
     def register_singleton(
@@ -87,7 +101,7 @@ class ServiceContainer(IServiceContainer):
         self._services[service_type] = ServiceRegistration(
             factory, ServiceLifecycle.SINGLETON
         )
-        self.logger.debug(f"Registered singleton: {service_type.__name__}")
+        self.logger.debug("Registered singleton: %s", service_type.__name__)
 
     def register_transient(
         self, service_type: Type[T], factory: Callable[[], T]
@@ -102,7 +116,9 @@ class ServiceContainer(IServiceContainer):
         self._services[service_type] = ServiceRegistration(
             factory, ServiceLifecycle.TRANSIENT
         )
-        self.logger.debug(f"Registered transient: {service_type.__name__}")
+        # 丟棄舊註冊留下的實例，避免 resolve 快速路徑返回它
+        self._instances.pop(service_type, None)
+        self.logger.debug("Registered transient: %s", service_type.__name__)
 
     def register_instance(self, service_type: Type[T], instance: T) -> None:
         """
@@ -115,7 +131,9 @@ class ServiceContainer(IServiceContainer):
         self._services[service_type] = ServiceRegistration(
             lambda: instance, ServiceLifecycle.INSTANCE
         )
-        self.logger.debug(f"Registered instance: {service_type.__name__}")
+        # 丟棄舊註冊留下的實例，避免 resolve 快速路徑返回它
+        self._instances.pop(service_type, None)
+        self.logger.debug("Registered instance: %s", service_type.__name__)
 
     def resolve(self, service_type: Type[T]) -> T:
         """
@@ -130,6 +148,11 @@ class ServiceContainer(IServiceContainer):
         Raises:
             ValueError: 如果服務未註冊
         """
+        # 快速路徑：已創建的單例或已登記的實例
+        instance = self._instances.get(service_type, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
         if service_type not in self._services:
             # 嘗試自動解析
             if self._dependency_resolver:
@@ -139,50 +162,76 @@ class ServiceContainer(IServiceContainer):
 
         registration = self._services[service_type]
 
-        if registration.lifecycle == ServiceLifecycle.SINGLETON:
-            # 單例模式：如果已存在實例，直接返回
-            if service_type in self._instances:
-                return self._instances[service_type]
-
-            # 創建新實例
-            instance = registration.factory()
-            self._instances[service_type] = instance
-
-            # 註冊到生命週期管理器
-            self._lifecycle_manager.register_service_created(instance)
-            self._lifecycle_manager.initialize_service(instance)
-
-            self.logger.debug(f"Created singleton instance of {service_type.__name__}")
-            return instance
-
-        elif registration.lifecycle == ServiceLifecycle.TRANSIENT:
-            # 瞬態模式：每次都創建新實例
-            instance = registration.factory()
-
-            # 註冊到生命週期管理器
-            self._lifecycle_manager.register_service_created(instance)
-            self._lifecycle_manager.initialize_service(instance)
+        handler = self._lifecycle_handlers.get(registration.lifecycle)
+        if handler is None:
+            raise ValueError(f"Unknown service lifecycle: {registration.lifecycle}")
+        return handler(service_type, registration)
+
+    def _resolve_singleton(
+        self, service_type: Type[T], registration: ServiceRegistration
+    ) -> T:
+        """單例模式：創建實例並緩存（已緩存的實例由 resolve 的快速路徑返回）"""
+        instance = registration.factory()
+        self._instances[service_type] = instance
+
+        # 註冊到生命週期管理器
+        self._lifecycle_manager.register_service_created(instance)
+        self._lifecycle_manager.initialize_service(instance)
+
+        self.logger.debug("Created singleton instance of %s", service_type.__name__)
+        return instance
+
+    def _resolve_transient(
+        self, service_type: Type[T], registration: ServiceRegistration
+    ) -> T:
+        """瞬態模式：每次都創建新實例"""
+        instance = registration.factory()
+
+        # 註冊到生命週期管理器
+        self._lifecycle_manager.register_service_created(instance)
+        self._lifecycle_manager.initialize_service(instance)
+
+        self.logger.debug("Created transient instance of %s", service_type.__name__)
+        return instance
+
+    def _resolve_instance(
+        self, service_type: Type[T], registration: ServiceRegistration
+    ) -> T:
+        """實例模式：首次解析時登記預註冊的實例（之後由 resolve 的快速路徑返回）"""
+        instance = registration.factory()
+
+        # 註冊到生命週期管理器
+        self._lifecycle_manager.register_service_created(instance)
+        self._lifecycle_manager.initialize_service(instance)
+        self._instances[service_type] = instance
+
+        self.logger.debug(
+            "Returned registered instance of %s", service_type.__name__
+        )
+        return instance
 
-            self.logger.debug(f"Created transient instance of {service_type.__name__}")
-            return instance
+    def resolve_or_none(self, service_type: Type[T], default: Any = None) -> Any:
+        """
+        解析已註冊的服務，未註冊時返回默認值（不觸發自動解析）
 
-        elif registration.lifecycle == ServiceLifecycle.INSTANCE:
-            # 實例模式：直接返回預註冊的實例
-            instance = registration.factory()
+        Args:
+            service_type: 服務類型
+            default: 服務未註冊時的返回值
 
-            # 註冊到生命週期管理器（如果還沒註冊）
-            if service_type not in self._instances:
-                self._lifecycle_manager.register_service_created(instance)
-                self._lifecycle_manager.initialize_service(instance)
-                self._instances[service_type] = instance
+        Returns:
+            服務實例或 default
+        """
+        registration = self._services.get(service_type)
+        if registration is None:
+            return default
 
-            self.logger.debug(
-                f"Returned registered instance of {service_type.__name__}"
-            )
-            return instance
+        # 已創建的單例直接返回
+        if registration.lifecycle is ServiceLifecycle.SINGLETON:
+            instance = self._instances.get(service_type, _MISSING)
+            if instance is not _MISSING:
+                return instance
 
-        else:
-            raise ValueError(f"Unknown service lifecycle: {registration.lifecycle}")
+        return self.resolve(service_type)
 
     def is_registered(self, service_type: Type[T]) -> bool:
         """
@@ -196,6 +245,18 @@ class ServiceContainer(IServiceContainer):
         """
         return service_type in self._services
 
+    def can_resolve(self, service_type: Type[T]) -> bool:
+        """
+        檢查服務是否可解析（已註冊，或已啟用自動解析）
+
+        Args:
+            service_type: 服務類型
+
+        Returns:
+            True如果 resolve 會嘗試創建該服務
+        """
+        return service_type in self._services or self._dependency_resolver is not None
+
     def get_registered_services(self) -> Dict[str, str]:
         """
         獲取已註冊的服務列表
@@ -272,15 +333,12 @@ class ServiceContainer(IServiceContainer):
         self.logger.info("ServiceContainer cleared")
 
 
-# 全局服務容器實例
-_container: Optional[ServiceContainer] = None
+# 全局服務容器實例，導入時創建，避免多線程下重複構造
+_container = ServiceContainer()
 
 
 def get_container() -> ServiceContainer:
     """獲取全局服務容器實例"""
-    global _container
-    if _container is None:
-        _container = ServiceContainer()
     return _container
 
 
@@ -288,3 +346,8 @@ def set_container(container: ServiceContainer):
     """設置全局服務容器實例"""
     global _container
     _container = container
+
+
+def reset_container():
+    """以新的服務容器替換全局實例（主要用於測試隔離）"""
+    set_container(ServiceContainer())
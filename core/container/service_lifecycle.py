@@ -6,7 +6,7 @@
 
 import logging
 import weakref
-from typing import Dict, List, Type, Any, Callable, Protocol
+from typing import Dict, List, Optional, Tuple, Type, Any, Callable, Protocol
 from enum import Enum
 
 
@@ -36,15 +36,24 @@ class IInitializable(Protocol):
         pass
 
 
+class _ServiceRef(weakref.ref):
+    """記錄服務 id 與狀態的弱引用，服務被回收時記錄隨之移除"""
+
+    __slots__ = ("service_id", "state")
+
+
 class ServiceLifecycleManager:
     """服務生命週期管理器"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-        # 服務狀態跟蹤
-        self._service_states: Dict[int, ServiceState] = {}
-        self._service_refs: Dict[int, weakref.ref] = {}
+        # 服務狀態跟蹤：服務 id -> 攜帶狀態的弱引用
+        self._service_refs: Dict[int, _ServiceRef] = {}
+        # 各狀態的服務數量，隨狀態變化增量維護
+        self._state_counts: Dict[ServiceState, int] = {
+            state: 0 for state in ServiceState
+        }
 
         # 生命週期事件處理器
         self._creation_handlers: List[Callable[[Any], None]] = []
@@ -54,6 +63,43 @@ class ServiceLifecycleManager:
         # 初始化順序管理
         self._initialization_order: List[Type] = []
         self._disposal_order: List[Type] = []
+        # 服務類型 -> 銷毀優先級，未指定順序的類型使用 len(_disposal_order)
+        self._disposal_index: Dict[Type, int] = {}
+
+        # 類型 -> (是否可初始化, 是否可釋放, 類名)；None 表示需按實例探測
+        self._class_cache: Dict[Type, Tuple[Optional[bool], Optional[bool], str]] = {}
+
+    def _set_state(self, service_ref: _ServiceRef, state: ServiceState):
+        """更新服務狀態並同步狀態計數"""
+        self._state_counts[service_ref.state] -= 1
+        service_ref.state = state
+        self._state_counts[state] += 1
+
+    def _track(self, service: Any) -> _ServiceRef:
+        """開始跟蹤服務（初始狀態為 CREATED）"""
+        service_id = id(service)
+        service_ref = _ServiceRef(service, self._on_service_garbage_collected)
+        service_ref.service_id = service_id
+        service_ref.state = ServiceState.CREATED
+        self._service_refs[service_id] = service_ref
+        self._state_counts[ServiceState.CREATED] += 1
+        return service_ref
+
+    def _probe(self, service_type: Type) -> Tuple[Optional[bool], Optional[bool], str]:
+        """獲取服務類型的生命週期能力（按類型緩存）"""
+        capabilities = self._class_cache.get(service_type)
+        if capabilities is None:
+            if hasattr(service_type, "__getattr__"):
+                # 動態屬性（如 LazyProxy）無法按類型判斷
+                capabilities = (None, None, service_type.__name__)
+            else:
+                capabilities = (
+                    callable(getattr(service_type, "initialize", None)),
+                    callable(getattr(service_type, "dispose", None)),
+                    service_type.__name__,
+                )
+            self._class_cache[service_type] = capabilities
+        return capabilities
 
     def register_service_created(self, service: Any):
         """
@@ -62,22 +108,21 @@ class ServiceLifecycleManager:
         Args:
             service: 服務實例
         """
-        service_id = id(service)
-        self._service_states[service_id] = ServiceState.CREATED
-        self._service_refs[service_id] = weakref.ref(
-            service, self._on_service_garbage_collected
-        )
+        service_ref = self._service_refs.get(id(service))
+        if service_ref is None:
+            self._track(service)
+        else:
+            self._set_state(service_ref, ServiceState.CREATED)
 
-        self.logger.debug(f"Service created: {type(service).__name__}")
+        type_name = self._probe(type(service))[2]
+        self.logger.debug("Service created: %s", type_name)
 
         # 觸發創建事件
         for handler in self._creation_handlers:
             try:
                 handler(service)
             except Exception as e:
-                self.logger.error(
-                    f"Error in creation handler for {type(service).__name__}: {e}"
-                )
+                self.logger.error("Error in creation handler for %s: %s", type_name, e)
 
     def initialize_service(self, service: Any):
         """
@@ -86,26 +131,28 @@ class ServiceLifecycleManager:
         Args:
             service: 服務實例
         """
-        service_id = id(service)
-
-        if service_id not in self._service_states:
+        service_ref = self._service_refs.get(id(service))
+        if service_ref is None:
             self.register_service_created(service)
+            service_ref = self._service_refs[id(service)]
 
-        current_state = self._service_states.get(service_id)
+        current_state = service_ref.state
         if current_state in [ServiceState.INITIALIZED, ServiceState.INITIALIZING]:
             return  # 已經初始化或正在初始化
 
-        self._service_states[service_id] = ServiceState.INITIALIZING
+        self._set_state(service_ref, ServiceState.INITIALIZING)
+        has_initialize, _, type_name = self._probe(type(service))
 
         try:
             # 如果服務實現了IInitializable接口，調用initialize方法
-            if hasattr(service, "initialize") and callable(
-                getattr(service, "initialize")
-            ):
-                service.initialize()
+            # （類型已確認不可初始化時跳過查找，否則只查找一次屬性）
+            if has_initialize is not False:
+                initialize = getattr(service, "initialize", None)
+                if callable(initialize):
+                    initialize()
 
-            self._service_states[service_id] = ServiceState.INITIALIZED
-            self.logger.debug(f"Service initialized: {type(service).__name__}")
+            self._set_state(service_ref, ServiceState.INITIALIZED)
+            self.logger.debug("Service initialized: %s", type_name)
 
             # 觸發初始化事件
             for handler in self._initialization_handlers:
@@ -113,14 +160,12 @@ class ServiceLifecycleManager:
                     handler(service)
                 except Exception as e:
                     self.logger.error(
-                        f"Error in initialization handler for {type(service).__name__}: {e}"
+                        "Error in initialization handler for %s: %s", type_name, e
                     )
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to initialize service {type(service).__name__}: {e}"
-            )
-            self._service_states[service_id] = ServiceState.CREATED
+            self.logger.error("Failed to initialize service %s: %s", type_name, e)
+            self._set_state(service_ref, ServiceState.CREATED)
             raise
 
     def dispose_service(self, service: Any):
@@ -130,13 +175,14 @@ class ServiceLifecycleManager:
         Args:
             service: 服務實例
         """
-        service_id = id(service)
-
-        current_state = self._service_states.get(service_id)
-        if current_state in [ServiceState.DISPOSED, ServiceState.DISPOSING]:
+        service_ref = self._service_refs.get(id(service))
+        if service_ref is None:
+            service_ref = self._track(service)
+        elif service_ref.state in [ServiceState.DISPOSED, ServiceState.DISPOSING]:
             return  # 已經銷毀或正在銷毀
 
-        self._service_states[service_id] = ServiceState.DISPOSING
+        self._set_state(service_ref, ServiceState.DISPOSING)
+        _, has_dispose, type_name = self._probe(type(service))
 
         try:
             # 觸發銷毀事件
@@ -145,20 +191,20 @@ class ServiceLifecycleManager:
                     handler(service)
                 except Exception as e:
                     self.logger.error(
-                        f"Error in disposal handler for {type(service).__name__}: {e}"
+                        "Error in disposal handler for %s: %s", type_name, e
                     )
 
             # 如果服務實現了IDisposable接口，調用dispose方法
-            if hasattr(service, "dispose") and callable(getattr(service, "dispose")):
-                service.dispose()
+            if has_dispose is not False:
+                dispose = getattr(service, "dispose", None)
+                if callable(dispose):
+                    dispose()
 
-            self._service_states[service_id] = ServiceState.DISPOSED
-            self.logger.debug(f"Service disposed: {type(service).__name__}")
+            self._set_state(service_ref, ServiceState.DISPOSED)
+            self.logger.debug("Service disposed: %s", type_name)
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to dispose service {type(service).__name__}: {e}"
-            )
+            self.logger.error("Failed to dispose service %s: %s", type_name, e)
             raise
 
     def dispose_all_services(self):
@@ -181,7 +227,7 @@ class ServiceLifecycleManager:
                 self.dispose_service(service)
             except Exception as e:
                 self.logger.error(
-                    f"Error disposing service {type(service).__name__}: {e}"
+                    "Error disposing service %s: %s", type(service).__name__, e
                 )
 
     def get_service_state(self, service: Any) -> ServiceState:
@@ -194,8 +240,10 @@ class ServiceLifecycleManager:
         Returns:
             服務狀態
         """
-        service_id = id(service)
-        return self._service_states.get(service_id, ServiceState.CREATED)
+        service_ref = self._service_refs.get(id(service))
+        if service_ref is None:
+            return ServiceState.CREATED
+        return service_ref.state
 
     def get_service_statistics(self) -> Dict[str, int]:
         """
@@ -204,16 +252,9 @@ class ServiceLifecycleManager:
         Returns:
             服務統計字典
         """
-        stats = {}
-        for state in ServiceState:
-            stats[state.value] = sum(
-                1 for s in self._service_states.values() if s == state
-            )
-
-        stats["total"] = len(self._service_states)
-        stats["active"] = len(
-            [ref for ref in self._service_refs.values() if ref() is not None]
-        )
+        stats = {state.value: count for state, count in self._state_counts.items()}
+        # 弱引用在服務被回收時即從記錄中移除，已記錄的服務均為存活服務
+        stats["total"] = stats["active"] = len(self._service_refs)
 
         return stats
 
@@ -236,36 +277,30 @@ class ServiceLifecycleManager:
     def set_disposal_order(self, service_types: List[Type]):
         """設置服務銷毀順序"""
         self._disposal_order = service_types.copy()
+        self._disposal_index = {}
+        for priority, service_type in enumerate(service_types):
+            # 重複的類型以首次出現的位置為準
+            self._disposal_index.setdefault(service_type, priority)
 
     def _get_disposal_priority(self, service_type: Type) -> int:
         """獲取服務銷毀優先級"""
-        try:
-            return self._disposal_order.index(service_type)
-        except ValueError:
-            return len(self._disposal_order)  # 未指定順序的服務最後銷毀
+        # 未指定順序的服務最後銷毀
+        return self._disposal_index.get(service_type, len(self._disposal_order))
 
-    def _on_service_garbage_collected(self, weak_ref):
+    def _on_service_garbage_collected(self, weak_ref: _ServiceRef):
         """服務被垃圾回收時的回調"""
-        # 清理相關記錄
-        service_id = None
-        for sid, ref in self._service_refs.items():
-            if ref is weak_ref:
-                service_id = sid
-                break
-
-        if service_id:
-            self._service_states.pop(service_id, None)
-            self._service_refs.pop(service_id, None)
-            self.logger.debug(f"Service garbage collected: {service_id}")
+        # 清理相關記錄；同一 id 可能已被新服務重新登記，只清理屬於此弱引用的記錄
+        service_id = weak_ref.service_id
+        if self._service_refs.get(service_id) is weak_ref:
+            del self._service_refs[service_id]
+            self._state_counts[weak_ref.state] -= 1
+            self.logger.debug("Service garbage collected: %s", service_id)
 
 
-# 全局生命週期管理器實例
-_lifecycle_manager = None
+# 全局生命週期管理器實例，導入時創建，避免多線程下重複構造
+_lifecycle_manager = ServiceLifecycleManager()
 
 
 def get_lifecycle_manager() -> ServiceLifecycleManager:
     """獲取全局生命週期管理器實例"""
-    global _lifecycle_manager
-    if _lifecycle_manager is None:
-        _lifecycle_manager = ServiceLifecycleManager()
     return _lifecycle_manager
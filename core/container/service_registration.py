@@ -4,6 +4,7 @@
 定義所有服務的註冊邏輯，包括依賴關係和生命週期管理。
 """
 
+import functools
 import tkinter as tk
 from typing import Dict, Any
 
@@ -15,6 +16,7 @@ from core.services import (
     ProjectService,
 )
 from core.services.theme_service import ThemeService
+from core.config.file_type_config import FileTypeConfig, get_file_type_config
 from core.state import AppStateManager
 from ui.main_window import MainWindow
 from ui.event_handlers import EventHandlers
@@ -41,22 +43,22 @@ class ServiceRegistration:
         self.container.register_instance(tk.Tk, root)
 
         # 2. 註冊核心服務（單例）
-        self._register_core_services(config)
+        self._register_core_services(root, config)
 
         # 3. 註冊狀態管理器（單例）
         self._register_state_manager(config)
 
         # 4. 註冊UI組件（單例）
-        self._register_ui_components()
+        self._register_ui_components(root)
 
         # 5. 註冊事件處理器（單例）
-        self._register_event_handlers()
+        self._register_event_handlers(root)
 
-    def _register_core_services(self, config: Dict[str, Any]):
-        """註冊核心服務"""
+    def _register_core_services(self, root: tk.Tk, config: Dict[str, Any]):
+        """註冊核心服務（註冊時已知的參數直接綁定到構造函數）"""
 
         # FileService - 文件操作服務
-        self.container.register_singleton(FileService, lambda: FileService())
+        self.container.register_singleton(FileService, FileService)
 
         # TranslationService - 翻譯服務
         def create_translation_service():
@@ -71,42 +73,41 @@ class ServiceRegistration:
         )
 
         # HighlightingService - 高亮服務
-        def create_highlighting_service():
-            enabled = config.get("highlighting_enabled", True)
-            return HighlightingService(enabled=enabled)
-
         self.container.register_singleton(
-            HighlightingService, create_highlighting_service
+            HighlightingService,
+            functools.partial(
+                HighlightingService, enabled=config.get("highlighting_enabled", True)
+            ),
         )
 
+        # FileTypeConfig - 文件類型配置（與全局實例共享，配置文件只解析一次），
+        # 配置修改在Tk空閒時合併保存
+        file_type_config = get_file_type_config()
+        file_type_config.set_idle_scheduler(root.after_idle)
+        self.container.register_instance(FileTypeConfig, file_type_config)
+
         # ProjectService - 項目服務
-        self.container.register_singleton(ProjectService, lambda: ProjectService())
-        
+        self.container.register_singleton(ProjectService, ProjectService)
+
         # ThemeService - 主題服務
-        def create_theme_service():
-            root = self.container.resolve(tk.Tk)
-            return ThemeService(root)
-        
-        self.container.register_singleton(ThemeService, create_theme_service)
+        self.container.register_singleton(
+            ThemeService, functools.partial(ThemeService, root)
+        )
 
     def _register_state_manager(self, config: Dict[str, Any]):
         """註冊狀態管理器"""
-        self.container.register_singleton(AppStateManager, lambda: AppStateManager())
+        self.container.register_singleton(AppStateManager, AppStateManager)
 
-    def _register_ui_components(self):
+    def _register_ui_components(self, root: tk.Tk):
         """註冊UI組件"""
+        self.container.register_singleton(
+            MainWindow, functools.partial(MainWindow, root)
+        )
 
-        def create_main_window():
-            root = self.container.resolve(tk.Tk)
-            return MainWindow(root)
-
-        self.container.register_singleton(MainWindow, create_main_window)
-
-    def _register_event_handlers(self):
+    def _register_event_handlers(self, root: tk.Tk):
         """註冊事件處理器"""
 
         def create_event_handlers():
-            root = self.container.resolve(tk.Tk)
             ui = self.container.resolve(MainWindow)
             state_manager = self.container.resolve(AppStateManager)
             file_service = self.container.resolve(FileService)
@@ -4,90 +4,115 @@
 """
 
 import logging
-from typing import Dict, List, Callable
-from abc import ABC, abstractmethod
+from typing import Dict, Tuple, Callable
+from abc import ABC
 
 
 class Event(ABC):
     """事件基類"""
 
-    def __init__(self, source: str = None):
-        self.source = source or "unknown"
+    __slots__ = ("source",)
 
-    @property
-    @abstractmethod
-    def event_type(self) -> str:
-        """事件類型標識"""
-        pass
+    # 事件類型標識，子類以類屬性聲明
+    event_type: str = ""
+
+    def __init__(self, source: str = "unknown"):
+        self.source = source
 
 
 class EventSystem:
     """事件發布/訂閱系統"""
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[Event], None]]] = {}
+        # 訂閱者以不可變元組保存，訂閱變更時整體替換，發布時無需複製
+        self._subscribers: Dict[str, Tuple[Callable[[Event], None], ...]] = {}
+        # 事件類型 -> 分發函數，訂閱變更時按訂閱者元組重新生成
+        self._dispatchers: Dict[str, Callable[[Event], None]] = {}
         self._logger = logging.getLogger(__name__)
 
+    def _update_dispatcher(self, event_type: str):
+        """根據當前訂閱者重新生成事件類型的分發函數"""
+        handlers = self._subscribers.get(event_type)
+        if not handlers:
+            self._subscribers.pop(event_type, None)
+            self._dispatchers.pop(event_type, None)
+            return
+
+        logger = self._logger
+
+        def dispatch(event: Event):
+            logger.debug("Publishing event '%s' from %s", event_type, event.source)
+
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(
+                        "Error in event handler %s for event '%s': %s",
+                        handler.__name__,
+                        event_type,
+                        e,
+                    )
+
+        self._dispatchers[event_type] = dispatch
+
+    def _dispatch_unsubscribed(self, event: Event):
+        """沒有訂閱者的事件的默認分發函數"""
+        self._logger.debug("No subscribers for event '%s'", event.event_type)
+
     def subscribe(self, event_type: str, handler: Callable[[Event], None]):
         """訂閱事件"""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-
-        self._subscribers[event_type].append(handler)
-        self._logger.debug(f"Subscribed to event '{event_type}': {handler.__name__}")
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (
+            handler,
+        )
+        self._update_dispatcher(event_type)
+        self._logger.debug(
+            "Subscribed to event '%s': %s", event_type, handler.__name__
+        )
 
     def unsubscribe(self, event_type: str, handler: Callable[[Event], None]):
         """取消訂閱事件"""
-        if event_type in self._subscribers:
+        handlers = self._subscribers.get(event_type)
+        if handlers is not None:
             try:
-                self._subscribers[event_type].remove(handler)
-                self._logger.debug(
-                    f"Unsubscribed from event '{event_type}': {handler.__name__}"
-                )
+                index = handlers.index(handler)
             except ValueError:
                 self._logger.warning(
-                    f"Handler {handler.__name__} not found for event '{event_type}'"
+                    "Handler %s not found for event '%s'", handler.__name__, event_type
                 )
+                return
+
+            self._subscribers[event_type] = handlers[:index] + handlers[index + 1 :]
+            self._update_dispatcher(event_type)
+            self._logger.debug(
+                "Unsubscribed from event '%s': %s", event_type, handler.__name__
+            )
 
     def publish(self, event: Event):
         """發布事件"""
-        event_type = event.event_type
-
-        if event_type not in self._subscribers:
-            self._logger.debug(f"No subscribers for event '{event_type}'")
-            return
-
-        self._logger.debug(f"Publishing event '{event_type}' from {event.source}")
-
-        for handler in self._subscribers[event_type]:
-            try:
-                handler(event)
-            except Exception as e:
-                self._logger.error(
-                    f"Error in event handler {handler.__name__} for event '{event_type}': {e}"
-                )
+        # 分發函數綁定了生成時的訂閱者元組，處理器中的訂閱變更不影響本次發布
+        self._dispatchers.get(event.event_type, self._dispatch_unsubscribed)(event)
 
     def get_subscriber_count(self, event_type: str) -> int:
         """獲取指定事件類型的訂閱者數量"""
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, ()))
 
     def clear_subscribers(self, event_type: str = None):
         """清除訂閱者"""
         if event_type:
             self._subscribers.pop(event_type, None)
-            self._logger.debug(f"Cleared subscribers for event '{event_type}'")
+            self._dispatchers.pop(event_type, None)
+            self._logger.debug("Cleared subscribers for event '%s'", event_type)
         else:
             self._subscribers.clear()
+            self._dispatchers.clear()
             self._logger.debug("Cleared all subscribers")
 
 
-# 全局事件系統實例
-_global_event_system = None
+# 全局事件系統實例，導入時創建
+_global_event_system = EventSystem()
 
 
 def get_event_system() -> EventSystem:
     """獲取全局事件系統實例"""
-    global _global_event_system
-    if _global_event_system is None:
-        _global_event_system = EventSystem()
     return _global_event_system
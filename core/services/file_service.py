@@ -1,6 +1,7 @@
 import os
 import shutil
-from typing import List, Dict, Tuple
+import sys
+from typing import List, Dict, Set, Tuple
 
 from parsers import BaseParser, get_parser_factory
 from core.models import StringEntry
@@ -12,6 +13,8 @@ class FileService:
     def __init__(self):
         # Maps file paths to their parser instances
         self.parsers: Dict[str, BaseParser] = {}
+        # 文件路徑 -> 已修改但尚未保存的條目 id；只跟蹤由本服務加載的文件
+        self.dirty: Dict[str, Set[int]] = {}
         # 獲取解析器工廠實例
         self.parser_factory = get_parser_factory()
 
@@ -22,6 +25,7 @@ class FileService:
     def load_directory(self, dir_path: str) -> Dict[str, List[StringEntry]]:
         """Loads all supported files from a directory and returns their string entries."""
         self.parsers.clear()
+        self.dirty.clear()
 
         # 使用解析器工廠獲取支持的文件
         supported_files = self.parser_factory.get_supported_files_in_directory(dir_path)
@@ -38,6 +42,7 @@ class FileService:
     ) -> Dict[str, List[StringEntry]]:
         """加載指定的文件列表"""
         self.parsers.clear()
+        self.dirty.clear()
         return self._load_files(file_paths)
 
     def _load_files(self, file_paths: List[str]) -> Dict[str, List[StringEntry]]:
@@ -50,15 +55,16 @@ class FileService:
                 parser = self.parser_factory.create_parser(filepath)
                 raw_strings = parser.get_utf8_strings()
 
-                # 獲取文件類型
-                file_extension = os.path.splitext(filepath)[1].lower()
+                # 獲取文件類型；路徑與擴展名駐留，所有條目共享同一字符串對象
+                file_name = sys.intern(filepath)
+                file_extension = sys.intern(os.path.splitext(filepath)[1].lower())
 
                 string_entries = [
                     StringEntry(
                         id=s["id"],
                         original=s["original"],
                         translated=s["translated"],
-                        file_name=filepath,  # 使用完整路徑而非只有文件名
+                        file_name=file_name,  # 使用完整路徑而非只有文件名
                         line_number=s.get("line_number", 0),
                         file_type=file_extension,  # 動態獲取文件類型
                         # Store a reference to the parser for saving later
@@ -68,8 +74,9 @@ class FileService:
                 ]
 
                 if string_entries:
-                    loaded_data[filepath] = string_entries
-                    self.parsers[filepath] = parser
+                    loaded_data[file_name] = string_entries
+                    self.parsers[file_name] = parser
+                    self.dirty[file_name] = set()
 
             except Exception as e:
                 filename = os.path.basename(filepath)
@@ -94,16 +101,41 @@ class FileService:
         if not os.path.exists(backup_path):
             shutil.copy2(filepath, backup_path)
 
-        update_count = 0
-        for entry in string_entries:
-            if entry.original != entry.translated:
-                parser.update_utf8_string(entry.id, entry.translated)
-                update_count += 1
-
-        if update_count > 0:
+        dirty_ids = self.dirty.get(filepath)
+        if dirty_ids is None:
+            # 未跟蹤修改的文件（如從工程文件恢復），逐條比較原文與譯文
+            updates = [
+                (entry.id, entry.translated)
+                for entry in string_entries
+                if entry.original != entry.translated
+            ]
+        elif dirty_ids:
+            updates = [
+                (entry.id, entry.translated)
+                for entry in string_entries
+                if entry.id in dirty_ids
+            ]
+        else:
+            updates = []
+
+        if updates:
+            parser.update_utf8_strings(updates)
             parser.save(filepath)
+            if dirty_ids is not None:
+                dirty_ids.clear()
+
+        return backup_path, len(updates)
+
+    def mark_dirty(self, filepath: str, entry_id: int):
+        """記錄條目譯文已修改，保存時只需寫回這些條目"""
+        dirty_ids = self.dirty.get(filepath)
+        if dirty_ids is not None:
+            dirty_ids.add(entry_id)
 
-        return backup_path, update_count
+    def set_parser(self, filepath: str, parser: BaseParser):
+        """為外部重建的數據（如工程文件）註冊解析器，其修改不做跟蹤"""
+        self.parsers[filepath] = parser
+        self.dirty.pop(filepath, None)
 
     def get_supported_extensions(self) -> List[str]:
         """獲取所有支持的文件擴展名"""
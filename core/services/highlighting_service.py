@@ -1,3 +1,57 @@
+import functools
+import re
+
+# Target encoding the translated strings must fit into
+_ENCODING = "euc-kr"
+
+
+@functools.lru_cache(maxsize=65536)
+def _is_encodable_char(char: str) -> bool:
+    """Check whether a single character is encodable (cached per character)."""
+    try:
+        char.encode(_ENCODING)
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+# Strings shorter than this are checked directly; caching them costs more than
+# the encode itself
+_CACHE_MIN_LENGTH = 8
+
+
+def _is_valid_impl(text: str) -> bool:
+    """Check whether the whole string encodes."""
+    try:
+        text.encode(_ENCODING)
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+def _get_invalid_ranges_impl(text: str) -> tuple[tuple[int, int], ...]:
+    """Find the (start, end) runs of characters that do not encode."""
+    # Fast path: the whole string encodes, nothing to highlight
+    if _is_valid_impl(text):
+        return ()
+
+    # Only test each distinct character once, then let the regex engine
+    # find the runs of invalid characters in a single pass
+    invalid_chars = "".join(
+        char for char in set(text) if not _is_encodable_char(char)
+    )
+    pattern = "[" + re.escape(invalid_chars) + "]+"
+    return tuple(match.span() for match in re.finditer(pattern, text))
+
+
+# Translations are re-validated on every edit and tree refresh, so the results
+# are memoized per text (both functions are pure)
+_cached_is_valid = functools.lru_cache(maxsize=4096)(_is_valid_impl)
+_cached_get_invalid_ranges = functools.lru_cache(maxsize=4096)(
+    _get_invalid_ranges_impl
+)
+
+
 class HighlightingService:
     """Service to detect characters not encodable in EUC-KR."""
 
@@ -10,38 +64,17 @@ class HighlightingService:
 
     def is_valid(self, text: str) -> bool:
         """Check if the entire string is valid in EUC-KR."""
-        if not self.enabled or not text:
+        # EUC-KR is a superset of ASCII
+        if not self.enabled or not text or text.isascii():
             return True
-        try:
-            text.encode("euc-kr")
-            return True
-        except UnicodeEncodeError:
-            return False
+        if len(text) < _CACHE_MIN_LENGTH:
+            return _is_valid_impl(text)
+        return _cached_is_valid(text)
 
     def get_invalid_ranges(self, text: str) -> list[tuple[int, int]]:
         """Get start and end indices of invalid character sequences."""
-        if not self.enabled or not text:
+        if not self.enabled or not text or text.isascii():
             return []
-
-        ranges = []
-        in_invalid_sequence = False
-        start = -1
-
-        for i, char in enumerate(text):
-            try:
-                char.encode("euc-kr")
-                if in_invalid_sequence:
-                    # End of an invalid sequence
-                    ranges.append((start, i))
-                    in_invalid_sequence = False
-            except UnicodeEncodeError:
-                if not in_invalid_sequence:
-                    # Start of a new invalid sequence
-                    in_invalid_sequence = True
-                    start = i
-
-        if in_invalid_sequence:
-            # The string ends with an invalid sequence
-            ranges.append((start, len(text)))
-
-        return ranges
+        if len(text) < _CACHE_MIN_LENGTH:
+            return list(_get_invalid_ranges_impl(text))
+        return list(_cached_get_invalid_ranges(text))
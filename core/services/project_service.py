@@ -1,11 +1,61 @@
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import base64
 import logging
+import os
+import re
+import sys
 import time
 from collections import Counter
+from xml.sax.saxutils import escape, quoteattr
 
 from core.models.string_entry import StringEntry
 
+# lxml is optional; when available its C parser is used to load projects
+try:
+    from lxml import etree as LET
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# 1.1 stores the short Entry fields as attributes instead of child elements
+PROJECT_FORMAT_VERSION = "1.1"
+
+# Characters outside the XML 1.0 Char production (C0 controls, lone
+# surrogates, U+FFFE/U+FFFF); class files can legitimately contain them,
+# e.g. the \x01 placeholders in StringConcatFactory recipes
+_INVALID_XML_CHARS = re.compile(
+    "[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+# Parsers normalise a literal \r to \n, so it is written as a character reference
+_TEXT_ENTITIES = {"\r": "&#13;"}
+
+
+def _text_element(tag, text):
+    """Serializes a text field, falling back to base64 when XML cannot hold it."""
+    if _INVALID_XML_CHARS.search(text):
+        payload = base64.b64encode(text.encode("utf-8", "surrogatepass"))
+        return f'<{tag} encoding="base64">{payload.decode("ascii")}</{tag}>'
+    return f"<{tag}>{escape(text, _TEXT_ENTITIES)}</{tag}>"
+
+
+def _attribute(name, value):
+    """Serializes an attribute value, refusing characters XML cannot hold."""
+    if _INVALID_XML_CHARS.search(value):
+        raise ValueError(
+            f"{name} contains characters that cannot be stored in XML: {value!r}"
+        )
+    return quoteattr(value)
+
+
+def _element_text(elem):
+    """Reads back a text field written by _text_element."""
+    text = elem.text or ""
+    if elem.get("encoding") == "base64":
+        return base64.b64decode(text).decode("utf-8", "surrogatepass")
+    return text
+
 
 class ProjectService:
     """Handles saving and loading of project files."""
@@ -18,46 +68,56 @@ class ProjectService:
             file_path (str): The path to save the project file.
             string_data (list): A list of StringEntry objects.
         """
+        # Write to a temporary file first so a failed save never leaves a
+        # truncated project behind
+        temp_path = file_path + ".tmp"
         try:
-            root = ET.Element(
-                "ClassEditorProject", version="1.0", created=str(int(time.time()))
-            )
-
-            # --- Project Info --- #
-            project_info = ET.SubElement(root, "ProjectInfo")
-            ET.SubElement(project_info, "TotalEntries").text = str(len(string_data))
-
-            # File statistics
-            if string_data:
-                file_types = [entry.file_type for entry in string_data]
-                stats = Counter(file_types)
-                file_stats_elem = ET.SubElement(project_info, "FileStats")
-                for f_type, count in stats.items():
-                    ET.SubElement(file_stats_elem, "File", type=f_type).text = str(
-                        count
-                    )
-
-            # --- String Entries --- #
-            entries_elem = ET.SubElement(root, "StringEntries")
-            for entry in string_data:
-                entry_elem = ET.SubElement(entries_elem, "Entry", id=str(entry.id))
-                ET.SubElement(entry_elem, "Original").text = entry.original
-                ET.SubElement(entry_elem, "Translated").text = entry.translated
-                ET.SubElement(entry_elem, "FileName").text = entry.file_name
-                ET.SubElement(entry_elem, "LineNumber").text = str(entry.line_number)
-                ET.SubElement(entry_elem, "FileType").text = entry.file_type
+            # The document is written out as it is generated, one entry at a
+            # time, so no tree of the whole project is ever built in memory
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                f.write(
+                    f'<ClassEditorProject version="{PROJECT_FORMAT_VERSION}" '
+                    f'created="{int(time.time())}">\n'
+                )
 
-            # Pretty print XML
-            rough_string = ET.tostring(root, "utf-8")
-            reparsed = minidom.parseString(rough_string)
-            pretty_xml = reparsed.toprettyxml(indent="  ", encoding="utf-8")
+                # --- Project Info --- #
+                f.write("  <ProjectInfo>\n")
+                f.write(f"    <TotalEntries>{len(string_data)}</TotalEntries>\n")
+
+                # File statistics
+                if string_data:
+                    stats = Counter(entry.file_type for entry in string_data)
+                    f.write("    <FileStats>\n")
+                    for f_type, count in stats.items():
+                        f.write(
+                            f"      <File type={_attribute('file_type', f_type)}>"
+                            f"{count}</File>\n"
+                        )
+                    f.write("    </FileStats>\n")
+                f.write("  </ProjectInfo>\n")
+
+                # --- String Entries --- #
+                f.write("  <StringEntries>\n")
+                for entry in string_data:
+                    f.write(
+                        f'    <Entry id="{entry.id}"'
+                        f" file_name={_attribute('file_name', entry.file_name)}"
+                        f' line_number="{entry.line_number}"'
+                        f" file_type={_attribute('file_type', entry.file_type)}>\n"
+                        f"      {_text_element('Original', entry.original)}\n"
+                        f"      {_text_element('Translated', entry.translated)}\n"
+                        f"    </Entry>\n"
+                    )
+                f.write("  </StringEntries>\n</ClassEditorProject>\n")
 
-            with open(file_path, "wb") as f:
-                f.write(pretty_xml)
+            os.replace(temp_path, file_path)
 
             logging.info(f"Project successfully saved to {file_path}")
             return True, f"工程已成功保存到 {file_path}"
         except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             logging.error(f"Failed to save project: {e}")
             return False, f"工程保存失败: {e}"
 
@@ -71,31 +131,64 @@ class ProjectService:
         Returns:
             tuple: A tuple containing (list_of_string_entries, project_metadata) or (None, None) on failure.
         """
+        etree = LET if LXML_AVAILABLE else ET
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
             string_data = []
-            for entry_elem in root.findall(".//StringEntries/Entry"):
-                entry = StringEntry(
-                    id=int(entry_elem.get("id")),
-                    original=entry_elem.find("Original").text or "",
-                    translated=entry_elem.find("Translated").text or "",
-                    file_name=entry_elem.find("FileName").text or "",
-                    line_number=int(entry_elem.find("LineNumber").text or 0),
-                    file_type=entry_elem.find("FileType").text or "",
-                )
-                string_data.append(entry)
+            root = None
+            entries_elem = None
+            total_entries = None
+            stats = {}
+
+            # Stream the file, building each entry as soon as its element is
+            # complete and dropping it right after, so the full tree is never
+            # held in memory
+            for event, elem in etree.iterparse(file_path, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    elif tag == "StringEntries":
+                        entries_elem = elem
+                    continue
+
+                if tag == "Entry":
+                    fields = {child.tag: _element_text(child) for child in elem}
+                    # Version 1.0 files store these as child elements
+                    file_name = elem.get("file_name")
+                    if file_name is None:
+                        file_name = fields.get("FileName")
+                    line_number = elem.get("line_number")
+                    if line_number is None:
+                        line_number = fields.get("LineNumber")
+                    file_type = elem.get("file_type")
+                    if file_type is None:
+                        file_type = fields.get("FileType")
+
+                    string_data.append(
+                        StringEntry(
+                            id=int(elem.get("id")),
+                            original=fields.get("Original") or "",
+                            translated=fields.get("Translated") or "",
+                            # 同一文件的條目共享駐留後的路徑與類型字符串
+                            file_name=sys.intern(file_name or ""),
+                            line_number=int(line_number or 0),
+                            file_type=sys.intern(file_type or ""),
+                        )
+                    )
+                    elem.clear()
+                    if entries_elem is not None:
+                        entries_elem.remove(elem)
+                elif tag == "TotalEntries":
+                    total_entries = elem.text
+                elif tag == "File":
+                    stats[elem.get("type")] = elem.text
 
             # Extract metadata
             metadata = {
-                "total_entries": root.find(".//TotalEntries").text,
+                "total_entries": total_entries,
                 "created": root.get("created"),
                 "version": root.get("version"),
-                "stats": {
-                    elem.get("type"): elem.text
-                    for elem in root.findall(".//FileStats/File")
-                },
+                "stats": stats,
             }
 
             logging.info(f"Project successfully loaded from {file_path}")
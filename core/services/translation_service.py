@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 # Import translator classes directly to support PyInstaller's one-file mode
 from translators.base_translator import BaseTranslator
@@ -12,6 +12,8 @@ class TranslationService:
         self.engines = self._load_engines()
         self.active_engine = None
         self.max_concurrent_requests = 5  # Default to 5 concurrent requests
+        # (engine name, source language, target language, text) -> translation
+        self._cache: Dict[Tuple[str, str, str, str], str] = {}
         if self.engines:
             self.set_active_engine(list(self.engines.keys())[0])
 
@@ -64,6 +66,8 @@ class TranslationService:
         """Updates the configurable rules for the currently active translation engine."""
         if self.active_engine:
             self.active_engine.update_rules(new_rules)
+            # Rules change the output, so earlier results are stale
+            self.clear_cache()
 
     def set_active_engine(self, name: str):
         """Sets the currently active translation engine."""
@@ -78,10 +82,37 @@ class TranslationService:
         """Translates text using the active engine, passing language parameters."""
         if not self.active_engine:
             raise ValueError("No active translation engine set.")
+
+        key = (self.active_engine.name, src_lang, dest_lang, text)
+        translated = self._cache.get(key)
+        if translated is not None:
+            return translated
+
         # Correctly pass all arguments to the underlying plugin.
-        return self.active_engine.translate(
+        translated = self.active_engine.translate(
             text, dest_lang=dest_lang, src_lang=src_lang
         )
+        # Only plain strings are successful translations; failure messages
+        # (TranslationFailure) and anything else are returned uncached
+        if type(translated) is str:
+            self._cache[key] = translated
+        return translated
+
+    def translate_many(
+        self, texts: List[str], dest_lang: str = "zh-cn", src_lang: str = "ko"
+    ) -> List[str]:
+        """Translates a list of texts, sending each distinct text only once."""
+        translated = {}
+        for text in texts:
+            if text not in translated:
+                translated[text] = self.translate(
+                    text, dest_lang=dest_lang, src_lang=src_lang
+                )
+        return [translated[text] for text in texts]
+
+    def clear_cache(self):
+        """Discards all cached translations."""
+        self._cache.clear()
 
     def get_max_concurrent_requests(self) -> int:
         """Returns the maximum number of concurrent translation requests."""
@@ -4,7 +4,9 @@
 """
 
 import logging
-from typing import Dict, List, Callable, Any, Optional
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, List, Callable, Any, Mapping, Optional
 from core.models import StringEntry
 
 
@@ -18,6 +20,12 @@ class AppStateManager:
         self._current_project_path: Optional[str] = None
         self._current_selected_entry_id: Optional[int] = None
 
+        # 派生數據緩存，文件集合變化時失效（翻譯修改不影響這些數據）
+        self._all_entries_cache: Optional[List[StringEntry]] = None
+        self._file_types_cache: Optional[Dict[str, int]] = None
+        # 文件路徑 -> (條目ID -> 條目)，按需為每個文件建立
+        self._entry_index: Dict[str, Dict[int, StringEntry]] = {}
+
         # 觀察者列表 - 用於通知狀態變化
         self._observers: Dict[str, List[Callable]] = {
             "files_loaded": [],
@@ -32,9 +40,9 @@ class AppStateManager:
     # ==================== 數據訪問方法 ====================
 
     @property
-    def open_files_data(self) -> Dict[str, List[StringEntry]]:
-        """獲取所有打開文件的數據"""
-        return self._open_files_data.copy()
+    def open_files_data(self) -> Mapping[str, List[StringEntry]]:
+        """獲取所有打開文件的數據（只讀視圖，修改請使用 add_file_data 等方法）"""
+        return MappingProxyType(self._open_files_data)
 
     @property
     def current_project_path(self) -> Optional[str]:
@@ -68,27 +76,49 @@ class AppStateManager:
 
     def get_selected_entry(self) -> Optional[StringEntry]:
         """獲取當前選中的條目"""
-        current_data = self.get_current_file_data()
-        if not current_data or self._current_selected_entry_id is None:
+        if self._current_selected_entry_id is None:
             return None
 
-        for entry in current_data:
-            if entry.id == self._current_selected_entry_id:
-                return entry
-        return None
+        entry_index = self._get_entry_index(self._current_selected_file)
+        if entry_index is None:
+            return None
+        return entry_index.get(self._current_selected_entry_id)
+
+    def _get_entry_index(
+        self, filepath: Optional[str]
+    ) -> Optional[Dict[int, StringEntry]]:
+        """獲取文件的條目ID索引，文件未打開時返回 None"""
+        entry_index = self._entry_index.get(filepath)
+        if entry_index is None:
+            file_data = self._open_files_data.get(filepath) if filepath else None
+            if not file_data:
+                return None
+            # 反向構建，ID 重複時保留第一個條目（與線性查找一致）
+            entry_index = {entry.id: entry for entry in reversed(file_data)}
+            self._entry_index[filepath] = entry_index
+        return entry_index
 
     def get_all_entries(self) -> List[StringEntry]:
-        """獲取所有文件的所有條目"""
-        all_entries = []
-        for file_data in self._open_files_data.values():
-            all_entries.extend(file_data)
-        return all_entries
+        """獲取所有文件的所有條目（返回緩存列表，調用方不應修改）"""
+        if self._all_entries_cache is None:
+            all_entries = []
+            for file_data in self._open_files_data.values():
+                all_entries.extend(file_data)
+            self._all_entries_cache = all_entries
+        return self._all_entries_cache
+
+    def _invalidate_caches(self):
+        """文件數據變化後清除派生數據緩存"""
+        self._all_entries_cache = None
+        self._file_types_cache = None
+        self._entry_index.clear()
 
     # ==================== 狀態修改方法 ====================
 
     def set_files_data(self, files_data: Dict[str, List[StringEntry]]):
         """設置文件數據（通常用於加載文件或項目）"""
         self._open_files_data = files_data.copy()
+        self._invalidate_caches()
         self._current_selected_file = None
         self._current_selected_entry_id = None
 
@@ -98,6 +128,7 @@ class AppStateManager:
     def add_file_data(self, filepath: str, data: List[StringEntry]):
         """添加單個文件的數據"""
         self._open_files_data[filepath] = data
+        self._invalidate_caches()
         logging.info(f"File data added: {filepath}")
         self._notify_observers(
             "file_data_changed", {"filepath": filepath, "data": data, "action": "added"}
@@ -107,6 +138,7 @@ class AppStateManager:
         """移除文件數據"""
         if filepath in self._open_files_data:
             del self._open_files_data[filepath]
+            self._invalidate_caches()
 
             # 如果移除的是當前選中的文件，清除選中狀態
             if self._current_selected_file == filepath:
@@ -124,6 +156,7 @@ class AppStateManager:
     def clear_all_data(self):
         """清空所有數據，包括文件和工程路徑"""
         self._open_files_data.clear()
+        self._invalidate_caches()
         self._current_selected_file = None
         self._current_project_path = None
         self._current_selected_entry_id = None
@@ -156,27 +189,28 @@ class AppStateManager:
 
     def update_entry_translation(self, entry_id: int, new_translation: str) -> bool:
         """更新條目的翻譯內容"""
-        current_data = self.get_current_file_data()
-        if not current_data:
+        entry_index = self._get_entry_index(self._current_selected_file)
+        if entry_index is None:
             return False
 
-        for entry in current_data:
-            if entry.id == entry_id:
-                old_translation = entry.translated
-                entry.translated = new_translation
+        entry = entry_index.get(entry_id)
+        if entry is None:
+            return False
 
-                logging.debug(f"Entry {entry_id} translation updated")
-                self._notify_observers(
-                    "entry_modified",
-                    {
-                        "entry_id": entry_id,
-                        "old_translation": old_translation,
-                        "new_translation": new_translation,
-                        "entry": entry,
-                    },
-                )
-                return True
-        return False
+        old_translation = entry.translated
+        entry.translated = new_translation
+
+        logging.debug(f"Entry {entry_id} translation updated")
+        self._notify_observers(
+            "entry_modified",
+            {
+                "entry_id": entry_id,
+                "old_translation": old_translation,
+                "new_translation": new_translation,
+                "entry": entry,
+            },
+        )
+        return True
 
     # ==================== 觀察者模式實現 ====================
 
@@ -211,18 +245,15 @@ class AppStateManager:
 
     def get_statistics(self) -> Dict[str, Any]:
         """獲取應用狀態統計信息"""
-        total_entries = sum(len(data) for data in self._open_files_data.values())
-        file_types = {}
-
-        for data in self._open_files_data.values():
-            for entry in data:
-                file_type = entry.file_type
-                file_types[file_type] = file_types.get(file_type, 0) + 1
+        if self._file_types_cache is None:
+            self._file_types_cache = dict(
+                Counter(entry.file_type for entry in self.get_all_entries())
+            )
 
         return {
             "total_files": len(self._open_files_data),
-            "total_entries": total_entries,
-            "file_types": file_types,
+            "total_entries": len(self.get_all_entries()),
+            "file_types": self._file_types_cache.copy(),
             "current_file": self._current_selected_file,
             "current_entry_id": self._current_selected_entry_id,
         }
@@ -14,6 +14,12 @@ class BaseParser(ABC):
         """Update a specific UTF-8 string by its index."""
         pass
 
+    def update_utf8_strings(self, updates):
+        """Update several UTF-8 strings from (index, new_string) pairs."""
+        update = self.update_utf8_string
+        for index, new_string in updates:
+            update(index, new_string)
+
     @abstractmethod
     def save(self, output_path):
         """Save the modified file content to a given path."""
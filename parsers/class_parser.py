@@ -15,7 +15,37 @@ CONSTANT_InterfaceMethodref = 11
 CONSTANT_NameAndType = 12
 CONSTANT_MethodHandle = 15
 CONSTANT_MethodType = 16
+CONSTANT_Dynamic = 17
 CONSTANT_InvokeDynamic = 18
+CONSTANT_Module = 19
+CONSTANT_Package = 20
+
+# Body size in bytes (after the tag) of every fixed-size constant pool entry
+_CP_FIXED_SIZE = {
+    CONSTANT_Integer: 4,
+    CONSTANT_Float: 4,
+    CONSTANT_Long: 8,
+    CONSTANT_Double: 8,
+    CONSTANT_Class: 2,
+    CONSTANT_String: 2,
+    CONSTANT_Fieldref: 4,
+    CONSTANT_Methodref: 4,
+    CONSTANT_InterfaceMethodref: 4,
+    CONSTANT_NameAndType: 4,
+    CONSTANT_MethodHandle: 3,
+    CONSTANT_MethodType: 2,
+    CONSTANT_Dynamic: 4,
+    CONSTANT_InvokeDynamic: 4,
+    CONSTANT_Module: 2,
+    CONSTANT_Package: 2,
+}
+# Entries that take up two constant pool slots
+_CP_DOUBLE_SLOT = frozenset((CONSTANT_Long, CONSTANT_Double))
+
+# Precompiled big-endian formats; unpack_from reads straight from the buffer
+_U16 = struct.Struct(">H")
+_U16_UNPACK = _U16.unpack_from
+_U16_PACK = _U16.pack
 
 
 class ClassParser(BaseParser):
@@ -31,12 +61,15 @@ class ClassParser(BaseParser):
 
     def _parse(self):
         self.header["magic"] = self.data[0:4]
-        self.header["minor_version"] = struct.unpack(">H", self.data[4:6])[0]
-        self.header["major_version"] = struct.unpack(">H", self.data[6:8])[0]
-        self.header["constant_pool_count"] = struct.unpack(">H", self.data[8:10])[0]
+        self.header["minor_version"] = _U16_UNPACK(self.data, 4)[0]
+        self.header["major_version"] = _U16_UNPACK(self.data, 6)[0]
+        self.header["constant_pool_count"] = _U16_UNPACK(self.data, 8)[0]
 
         cp_count = self.header["constant_pool_count"]
         offset = 10
+        # Raw entries are views into the original buffer; only rewritten
+        # entries get their own bytes
+        data_view = memoryview(self.data)
 
         i = 1
         while i < cp_count:
@@ -47,38 +80,21 @@ class ClassParser(BaseParser):
             info = {"tag": tag, "index": i}
             is_long_or_double = False
 
-            if tag == CONSTANT_Utf8:
-                length = struct.unpack(">H", self.data[offset : offset + 2])[0]
+            size = _CP_FIXED_SIZE.get(tag)
+            if size is not None:
+                offset += size
+                is_long_or_double = tag in _CP_DOUBLE_SLOT
+            elif tag == CONSTANT_Utf8:
+                length = _U16_UNPACK(self.data, offset)[0]
                 offset += 2
+                raw = self.data[offset : offset + length]
                 try:
-                    text = self.data[offset : offset + length].decode("utf-8")
+                    text = raw.decode("utf-8")
                 except UnicodeDecodeError:
-                    text = self.data[offset : offset + length].decode(
-                        "latin-1"
-                    )  # Fallback
+                    text = raw.decode("latin-1")  # Fallback
                 info["length"] = length
                 info["text"] = text
                 offset += length
-            elif tag in [CONSTANT_Integer, CONSTANT_Float]:
-                offset += 4
-            elif tag in [CONSTANT_Long, CONSTANT_Double]:
-                offset += 8
-                is_long_or_double = True
-            elif tag == CONSTANT_Class:
-                offset += 2
-            elif tag == CONSTANT_String:
-                offset += 2
-            elif tag in [
-                CONSTANT_Fieldref,
-                CONSTANT_Methodref,
-                CONSTANT_InterfaceMethodref,
-                CONSTANT_NameAndType,
-            ]:
-                offset += 4
-            elif tag in [CONSTANT_MethodHandle, CONSTANT_MethodType]:
-                offset += 3
-            elif tag == CONSTANT_InvokeDynamic:
-                offset += 4
             else:
                 if i == cp_count - 1 and len(self.constant_pool) == cp_count - 2:
                     break
@@ -89,16 +105,18 @@ class ClassParser(BaseParser):
             entry_end_offset = offset
             self.constant_pool.append(info)
             self.constant_pool_raw.append(
-                self.data[entry_start_offset:entry_end_offset]
+                data_view[entry_start_offset:entry_end_offset]
             )
 
             if is_long_or_double:
+                # Keep both lists aligned with constant pool indices
                 self.constant_pool.append(None)
+                self.constant_pool_raw.append(b"")
                 i += 2
             else:
                 i += 1
 
-        self.post_cp_data = self.data[offset:]
+        self.post_cp_data = data_view[offset:]
 
     def get_utf8_strings(self):
         strings = []
@@ -119,6 +137,8 @@ class ClassParser(BaseParser):
             raise ValueError(
                 f"Constant pool entry at index {index} is not a UTF-8 string."
             )
+        if new_string == entry["text"]:
+            return  # Unchanged, keep the original bytes
 
         try:
             new_bytes = new_string.encode("utf-8")
@@ -129,7 +149,7 @@ class ClassParser(BaseParser):
 
         new_raw_entry = bytearray()
         new_raw_entry.append(CONSTANT_Utf8)
-        new_raw_entry.extend(struct.pack(">H", new_len))
+        new_raw_entry.extend(_U16_PACK(new_len))
         new_raw_entry.extend(new_bytes)
 
         self.constant_pool_raw[index - 1] = new_raw_entry
@@ -137,13 +157,11 @@ class ClassParser(BaseParser):
         entry["length"] = new_len
 
     def save(self, output_path):
-        new_data = bytearray()
-        new_data.extend(self.data[:10])
-
-        for raw_entry in self.constant_pool_raw:
-            new_data.extend(raw_entry)
-
-        new_data.extend(self.post_cp_data)
+        # join sizes the output from the known part lengths and copies each
+        # part once, without growing a buffer entry by entry
+        new_data = b"".join(
+            (self.data[:10], *self.constant_pool_raw, self.post_cp_data)
+        )
 
         with open(output_path, "wb") as f:
             f.write(new_data)
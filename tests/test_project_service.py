@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from core.models import StringEntry
+from core.services.project_service import ProjectService
+
+
+def _entry(
+    entry_id, original, translated, file_name="/classes/a.class", file_type=".class"
+):
+    return StringEntry(
+        id=entry_id,
+        original=original,
+        translated=translated,
+        file_name=file_name,
+        line_number=entry_id,
+        file_type=file_type,
+    )
+
+
+class ProjectServiceRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "project.cep")
+        self.service = ProjectService()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _round_trip(self, entries):
+        ok, message = self.service.save_project(self.path, entries)
+        self.assertTrue(ok, message)
+        loaded, metadata = self.service.load_project(self.path)
+        self.assertIsNotNone(loaded, "saved project could not be loaded")
+        return loaded, metadata
+
+    def test_special_text_round_trips(self):
+        entries = [
+            _entry(1, "a\x01b", "\x01 + \x02"),
+            _entry(2, "line1\rline2\r\nline3", "tab\there\n"),
+            _entry(3, "<![CDATA[x]]>", "a ]]> b"),
+            _entry(4, "say \"hi\" & 'bye'", "<tag attr=\"v\">"),
+            _entry(5, "\ud800 lone surrogate", "\ufffe\uffff"),
+            _entry(6, "", "안녕하세요 😀"),
+        ]
+        loaded, metadata = self._round_trip(entries)
+        self.assertEqual(loaded, entries)
+        self.assertEqual(metadata["total_entries"], "6")
+
+    def test_special_file_name_round_trips(self):
+        entries = [_entry(1, "x", "y", file_name="/it's/a \"b\"\r.class")]
+        loaded, _ = self._round_trip(entries)
+        self.assertEqual(loaded, entries)
+
+    def test_unstorable_attribute_fails_without_touching_file(self):
+        for field in ({"file_name": "/bad\x01.class"}, {"file_type": ".bad\x01"}):
+            with self.subTest(**field):
+                with open(self.path, "w", encoding="utf-8") as f:
+                    f.write("previous")
+
+                ok, _ = self.service.save_project(
+                    self.path, [_entry(1, "x", "y", **field)]
+                )
+
+                self.assertFalse(ok)
+                with open(self.path, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), "previous")
+                self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,16 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any
 
 
+class TranslationFailure(str):
+    """A failure message returned by translate() in place of a translation.
+
+    It is still a str, so callers can show it to the user, but it is not a
+    successful result and must not be cached as one.
+    """
+
+    __slots__ = ()
+
+
 class BaseTranslator(ABC):
     """Abstract base class for all translator plugins."""
 
@@ -15,7 +25,11 @@ class BaseTranslator(ABC):
     def translate(
         self, text: str, dest_lang: str = "zh-cn", src_lang: str = "ko"
     ) -> str:
-        """Translate the given text."""
+        """Translate the given text.
+
+        On failure, return a TranslationFailure describing the problem
+        instead of a translation.
+        """
         pass
 
     def is_available(self) -> bool:
@@ -10,7 +10,7 @@ import json
 import re
 import time
 from html import unescape
-from .base_translator import BaseTranslator
+from .base_translator import BaseTranslator, TranslationFailure
 
 
 class LightGoogleTranslator(BaseTranslator):
@@ -60,7 +60,9 @@ class LightGoogleTranslator(BaseTranslator):
     def translate(self, text, src_lang="auto", dest_lang="zh-cn"):
         """Translate the given text using the direct Google Translate API."""
         if not self.is_available():
-            return "The 'requests' library is not installed. Please run: pip install requests"
+            return TranslationFailure(
+                "The 'requests' library is not installed. Please run: pip install requests"
+            )
 
         if not text:
             return ""
@@ -118,7 +120,7 @@ class LightGoogleTranslator(BaseTranslator):
                 if attempt < retries - 1:
                     time.sleep(delay)
                 else:
-                    return "[翻译失败: 网络错误]"
+                    return TranslationFailure("[翻译失败: 网络错误]")
             except Exception as e:
                 print(f"An unexpected error occurred: {e}")
-                return f"[翻译失败，請檢查 API_KEY: {e}]"
+                return TranslationFailure(f"[翻译失败，請檢查 API_KEY: {e}]")
@@ -129,7 +129,7 @@ class EventHandlers:
                         entry.parser_ref = parser
 
                     # 在 FileService 中註冊 parser
-                    self.file_service.parsers[filepath] = parser
+                    self.file_service.set_parser(filepath, parser)
 
                     success_count += 1
                     logging.info(f"Successfully rebuilt parser for {filepath}")
@@ -642,6 +642,7 @@ class EventHandlers:
                     translated_text = self.translation_service.translate(entry.original)
                     if translated_text != entry.translated:
                         entry.translated = translated_text
+                        self.file_service.mark_dirty(entry.file_name, entry.id)
                         self.event_system.publish(
                             TreeItemUpdateEvent(entry.id, translated_text)
                         )
@@ -741,6 +742,7 @@ class EventHandlers:
             if num_subs > 0:
                 count += 1
                 entry.translated = new_translated
+                self.file_service.mark_dirty(entry.file_name, entry.id)
                 self.event_system.publish(TreeItemUpdateEvent(entry.id, new_translated))
 
         self.event_system.publish(
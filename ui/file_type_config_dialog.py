@@ -215,9 +215,8 @@ class FileTypeConfigDialog:
                     messagebox.showerror("錯誤", f"無效的擴展名格式: {ext}")
                     return
 
-            # 更新配置
-            self.config.set_text_extensions(text_extensions)
-            self.config.save_config()
+            # 一次性更新配置，有變化時只保存一次
+            self.config.update_text_extensions(text_extensions)
 
             self.result = True
             self.dialog.destroy()
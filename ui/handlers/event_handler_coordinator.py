@@ -64,6 +64,9 @@ class EventHandlerCoordinator:
         # 註冊所有命令
         self._register_all_commands()
 
+        # 譯文修改時記錄髒條目，保存時只寫回修改過的條目
+        self.state_manager.subscribe("entry_modified", self._on_entry_modified)
+
         logging.info("EventHandlerCoordinator initialized with all handlers")
 
     def _create_handlers(self):
@@ -104,6 +107,11 @@ class EventHandlerCoordinator:
 
         logging.info(f"Registered commands from {len(self.all_handlers)} handlers")
 
+    def _on_entry_modified(self, data):
+        """條目譯文修改後標記為待保存"""
+        entry = data["entry"]
+        self.file_service.mark_dirty(entry.file_name, entry.id)
+
     def get_command_handler(self, command_name: str):
         """獲取命令處理器，用於UI綁定（保持與原EventHandlers相同的接口）"""
         return self.command_invoker.create_command_handler(command_name)
@@ -154,7 +154,7 @@ class ProjectHandlers(BaseHandler):
                         entry.parser_ref = parser
 
                     # 在 FileService 中註冊 parser
-                    self.file_service.parsers[filepath] = parser
+                    self.file_service.set_parser(filepath, parser)
 
                     success_count += 1
                     logging.info(f"Successfully rebuilt parser for {filepath}")
@@ -113,27 +113,30 @@ class TranslationHandlers(BaseHandler):
             StatusBarUpdateEvent(f"開始批量翻譯 {total} 個項目...")
         )
 
+        # 相同原文只翻譯一次，結果分發給所有對應的條目
+        entries_by_text = {}
+        for entry in entries_to_translate:
+            entries_by_text.setdefault(entry.original, []).append(entry)
+
         # 使用線程池進行並發翻譯
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=self.translation_service.get_max_concurrent_requests()
         ) as executor:
-            # 提交所有翻譯任務
-            future_to_entry = {
-                executor.submit(
-                    self.translation_service.translate, entry.original
-                ): entry
-                for entry in entries_to_translate
+            # 每個不同的原文提交一個翻譯任務
+            future_to_entries = {
+                executor.submit(self.translation_service.translate, text): entries
+                for text, entries in entries_by_text.items()
             }
 
             # 處理完成的翻譯
-            for future in concurrent.futures.as_completed(future_to_entry):
-                entry = future_to_entry[future]
-                try:
-                    # 在主線程中更新UI
-                    self.root.after(0, self._on_translation_complete, future, entry)
-                except Exception as e:
-                    logging.error(f"Translation failed for entry {entry.id}: {e}")
-                    self.root.after(0, self._on_translation_error, entry, str(e))
+            for future in concurrent.futures.as_completed(future_to_entries):
+                for entry in future_to_entries[future]:
+                    try:
+                        # 在主線程中更新UI
+                        self.root.after(0, self._on_translation_complete, future, entry)
+                    except Exception as e:
+                        logging.error(f"Translation failed for entry {entry.id}: {e}")
+                        self.root.after(0, self._on_translation_error, entry, str(e))
 
     def _on_translation_complete(self, future, entry: StringEntry):
         """翻譯完成的回調，線程安全的UI更新"""
@@ -168,6 +171,7 @@ class TranslationHandlers(BaseHandler):
 
     def _update_ui_after_translation(self, entry: StringEntry, translated_text: str):
         """在主線程中執行實際的UI更新"""
+        publish = self.event_system.publish
         self.processed_count += 1
         total = len(
             [
@@ -179,31 +183,23 @@ class TranslationHandlers(BaseHandler):
 
         if translated_text != entry.translated:
             self.state_manager.update_entry_translation(entry.id, translated_text)
-            self.event_system.publish(TreeItemUpdateEvent(entry.id, translated_text))
+            publish(TreeItemUpdateEvent(entry.id, translated_text))
 
             if self.highlighting_service.enabled:
                 is_valid = self.highlighting_service.is_valid(translated_text)
-                self.event_system.publish(
-                    TreeItemHighlightEvent(entry.id, not is_valid)
-                )
+                publish(TreeItemHighlightEvent(entry.id, not is_valid))
 
         # 對於單個翻譯，也更新編輯器
         if total == 1:
-            self.event_system.publish(
-                EditorTextUpdateEvent(entry.original, entry.translated)
-            )
+            publish(EditorTextUpdateEvent(entry.original, entry.translated))
             # 更新高亮（通過事件系統）
             if self.highlighting_service.enabled:
                 is_valid = self.highlighting_service.is_valid(entry.translated)
                 ranges = self.highlighting_service.get_invalid_ranges(entry.translated)
-                self.event_system.publish(TextHighlightUpdateEvent(ranges))
-                self.event_system.publish(
-                    TreeItemHighlightEvent(entry.id, not is_valid)
-                )
+                publish(TextHighlightUpdateEvent(ranges))
+                publish(TreeItemHighlightEvent(entry.id, not is_valid))
 
-        self.event_system.publish(
-            StatusBarUpdateEvent(f"翻譯進度: {self.processed_count}/{total}")
-        )
+        publish(StatusBarUpdateEvent(f"翻譯進度: {self.processed_count}/{total}"))
 
     def _on_translation_complete(self, future, entry):
         """翻譯完成回調（線程安全的UI更新）"""
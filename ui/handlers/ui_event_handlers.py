@@ -278,8 +278,12 @@ class UIEventHandlers(BaseHandler):
         # 恢復狀態
         entry.translated = last_state["translated_text"]
 
-        # 更新狀態管理器
-        self.state_manager.update_entry_translation(entry.id, last_state["translated_text"])
+        # 更新狀態管理器（觸發 entry_modified，由協調器標記為待保存）
+        if not self.state_manager.update_entry_translation(
+            entry.id, last_state["translated_text"]
+        ):
+            # 條目不在當前選中的文件中，不會觸發 entry_modified
+            self.file_service.mark_dirty(entry.file_name, entry.id)
 
         # 更新UI
         # 1. 更新編輯器
@@ -32,6 +32,7 @@ class MainWindow(IMainWindow):
         self.status_var = tk.StringVar()
         
         # UI组件将在setup_ui中初始化
+        self.file_menu = None
         self.editor_view = None
         self.file_tabs_view = None
 
@@ -44,12 +45,31 @@ class MainWindow(IMainWindow):
         self.handlers = handlers
         # 不再需要lambda佔位符，直接使用命令模式
 
+    def _setup_steps(self):
+        """按順序返回構建界面的各個步驟"""
+        return (
+            self._create_menu_bar,
+            self._create_main_layout,
+            self._sync_theme_styles,
+            self._create_status_bar,
+            self._setup_keyboard_shortcuts,  # 設置快捷鍵
+            self.disable_file_operations,  # Start in a disabled state
+        )
+
     def setup_ui(self):
-        self._create_menu_bar()
-        self._create_main_layout()
-        self._create_status_bar()
-        self._setup_keyboard_shortcuts()  # 設置快捷鍵
-        self.disable_file_operations()  # Start in a disabled state
+        for step in self._setup_steps():
+            step()
+
+    def setup_ui_deferred(self):
+        """分步構建界面，每個空閒週期執行一步，使事件循環儘早開始並繪製窗口"""
+        steps = collections.deque(self._setup_steps())
+
+        def run_next_step():
+            steps.popleft()()
+            if steps:
+                self.root.after_idle(run_next_step)
+
+        self.root.after_idle(run_next_step)
 
     def _subscribe_to_events(self):
         """訂閱UI相關事件"""
@@ -298,6 +318,18 @@ class MainWindow(IMainWindow):
         # 设置初始比例和窗口大小变化监听
         self._setup_paned_window_ratio()
 
+    def _sync_theme_styles(self):
+        """主題可能先於編輯器和樹狀視圖應用，為新建的組件補上當前主題的樣式"""
+        theme_service = self._get_theme_service()
+        if theme_service:
+            self._on_theme_changed_event(
+                ThemeChangedEvent(
+                    source=theme_service,
+                    theme_name=theme_service.get_current_theme(),
+                    theme_data=theme_service.get_current_theme_data(),
+                )
+            )
+
     def _create_component_handlers(self) -> dict:
         """创建传递给组件的处理器字典"""
         return {
@@ -503,10 +535,12 @@ class MainWindow(IMainWindow):
             self.file_tabs_view.select_tree_items(item_ids)
 
     def enable_file_operations(self):
-        self.file_menu.entryconfig("保存當前文件", state="normal")
+        if self.file_menu:
+            self.file_menu.entryconfig("保存當前文件", state="normal")
 
     def disable_file_operations(self):
-        self.file_menu.entryconfig("保存當前文件", state="disabled")
+        if self.file_menu:
+            self.file_menu.entryconfig("保存當前文件", state="disabled")
         if self.editor_view:
             self.editor_view.set_apply_button_state(False)
 